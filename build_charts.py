@@ -0,0 +1,365 @@
+"""
+Parallel Chart Build Orchestrator
+Discovers every chart builder (make_* in regenerate_all_screenshots.py,
+generate_* in the generate_*_visualizations.py scripts, chart_* in
+scripts/gen_dfm_infographics.py) and renders them in parallel worker
+processes with a per-task timeout, then prints a summary table.
+
+Builders are discovered by parsing the scripts, not importing them, so each
+worker imports its own script fresh and gets that script's Matplotlib style
+without leaking it into other charts. A full rebuild takes roughly as long
+as the slowest chart instead of the sum of all of them.
+
+Builds are incremental: chart_build_manifest.json records a fingerprint of
+each builder (its own source, the shared module-level code and local modules
+of its script, declared BUILD_INPUTS files, the Matplotlib/Pillow versions
+and the active matplotlibrc theme). Only builders whose fingerprint changed,
+or whose outputs are missing, are re-rendered.
+
+Usage:
+    python build_charts.py                    # build changed charts, one worker per core
+    python build_charts.py --force            # ignore the manifest and rebuild everything
+    python build_charts.py --jobs 4 --timeout 120
+    python build_charts.py --only fraud       # substring filter on task names
+    python build_charts.py --list
+    python build_charts.py --profile          # time/memory per chart -> chart_profile.json
+"""
+
+import argparse
+import ast
+import hashlib
+import importlib.util
+import json
+import multiprocessing as mp
+import os
+import queue
+import sys
+import time
+from collections import deque
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent
+MANIFEST = ROOT / "chart_build_manifest.json"
+PROFILE_REPORT = ROOT / "chart_profile.json"
+
+# (script, builder-name prefix)
+BUILD_SCRIPTS = [
+    ("regenerate_all_screenshots.py", "make_"),
+    ("generate_fraud_visualizations.py", "generate_"),
+    ("generate_forensic_visualizations.py", "generate_"),
+    ("generate_carousel_visualizations.py", "generate_"),
+    ("scripts/gen_dfm_infographics.py", "chart_"),
+]
+
+
+def discover(scripts=BUILD_SCRIPTS):
+    """Return [(task_name, script, function)] for every top-level builder"""
+    tasks = []
+    for script, prefix in scripts:
+        tree = ast.parse((ROOT / script).read_text(encoding="utf-8"), filename=script)
+        for node in tree.body:
+            if isinstance(node, ast.FunctionDef) and node.name.startswith(prefix):
+                tasks.append((f"{Path(script).stem}:{node.name}", script, node.name))
+    return tasks
+
+
+# ── Fingerprints & manifest ──────────────────────────────────────────────────
+
+def _local_modules(path, seen):
+    """Yield source paths of modules imported by `path` that live in this repo"""
+    tree = ast.parse(path.read_text(encoding="utf-8"))
+    for node in tree.body:
+        if isinstance(node, ast.Import):
+            names = [alias.name for alias in node.names]
+        elif isinstance(node, ast.ImportFrom) and node.module and not node.level:
+            names = [node.module]
+        else:
+            continue
+        for name in names:
+            for base in (path.parent, ROOT):
+                candidate = base / (name.replace(".", "/") + ".py")
+                if candidate.exists() and candidate not in seen:
+                    seen.add(candidate)
+                    yield candidate
+                    yield from _local_modules(candidate, seen)
+
+
+def _environment_hash():
+    """Library versions and the active matplotlibrc (the render 'theme')"""
+    import matplotlib
+    import PIL
+    h = hashlib.sha256(f"mpl={matplotlib.__version__};pil={PIL.__version__}".encode())
+    rc_file = matplotlib.matplotlib_fname()
+    if rc_file and os.path.exists(rc_file):
+        h.update(Path(rc_file).read_bytes())
+    return h.hexdigest()
+
+
+def fingerprints(tasks):
+    """Return {task_name: sha256} covering everything that affects each chart"""
+    env = _environment_hash()
+    shared = {}
+    result = {}
+    for name, script, func_name in tasks:
+        path = ROOT / script
+        source = path.read_text(encoding="utf-8")
+        tree = ast.parse(source)
+        if script not in shared:
+            prefix = dict(BUILD_SCRIPTS)[script]
+            h = hashlib.sha256(env.encode())
+            # Module-level code other than builders: imports, styles, palettes, helpers
+            for node in tree.body:
+                if not (isinstance(node, ast.FunctionDef) and node.name.startswith(prefix)):
+                    h.update((ast.get_source_segment(source, node) or "").encode())
+            for dep in sorted(_local_modules(path, set())):
+                h.update(dep.read_bytes())
+            # Optional data files a script declares as BUILD_INPUTS = ["data/x.csv", ...]
+            for node in tree.body:
+                if isinstance(node, ast.Assign) and any(
+                        isinstance(t, ast.Name) and t.id == "BUILD_INPUTS" for t in node.targets):
+                    for data_file in ast.literal_eval(node.value):
+                        data_path = ROOT / data_file
+                        h.update(data_path.read_bytes() if data_path.exists() else b"<missing>")
+            shared[script] = h.hexdigest()
+        func = next(n for n in tree.body if isinstance(n, ast.FunctionDef) and n.name == func_name)
+        h = hashlib.sha256(shared[script].encode())
+        h.update(ast.get_source_segment(source, func).encode())
+        result[name] = h.hexdigest()
+    return result
+
+
+def load_manifest():
+    if MANIFEST.exists():
+        return json.loads(MANIFEST.read_text(encoding="utf-8"))
+    return {"charts": {}}
+
+
+def save_manifest(manifest):
+    tmp = MANIFEST.with_name(MANIFEST.name + ".tmp")
+    tmp.write_text(json.dumps(manifest, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+    os.replace(tmp, MANIFEST)
+
+
+def is_current(entry, fingerprint):
+    """A chart is current if its fingerprint matches and every output still exists"""
+    return (entry is not None and entry.get("hash") == fingerprint
+            and entry.get("outputs") and all((ROOT / p).exists() for p in entry["outputs"]))
+
+
+def select_stale(tasks, force=False):
+    """Return (manifest, fingerprints, tasks that need rebuilding)"""
+    manifest = load_manifest()
+    hashes = fingerprints(tasks)
+    stale = [t for t in tasks if force or not is_current(manifest["charts"].get(t[0]), hashes[t[0]])]
+    return manifest, hashes, stale
+
+
+def record_results(manifest, rows, hashes):
+    """Store successful builds in the manifest and drop failed ones, then save it"""
+    for row in rows:
+        if row["status"] == "ok":
+            manifest["charts"][row["task"]] = {
+                "hash": hashes[row["task"]],
+                "outputs": row["outputs"],
+                "seconds": round(row["seconds"], 2),
+            }
+        else:
+            manifest["charts"].pop(row["task"], None)
+    save_manifest(manifest)
+
+
+def filter_tasks(tasks, only):
+    """Keep tasks whose name contains any of the given substrings"""
+    return [t for t in tasks if any(s in t[0] for s in only)] if only else tasks
+
+
+def _load_script(script):
+    """Import a build script by path under a private module name"""
+    path = ROOT / script
+    name = "_build_" + path.stem
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def run_builder(script, func_name):
+    """Run one builder in the current process; returns the paths it saved"""
+    import matplotlib
+    matplotlib.use("Agg")
+    from matplotlib.figure import Figure
+    import chart_output
+
+    # Record every file written through Figure.savefig (plt.savefig included)
+    # or through the shared chart_output writer, plus outputs it left untouched
+    # because they were visually unchanged
+    saved = []
+    original_savefig = Figure.savefig
+    original_write = chart_output.write_atomic
+    original_keep = chart_output.keep_existing
+
+    def recording_savefig(self, fname, *args, **kwargs):
+        if isinstance(fname, (str, os.PathLike)):
+            saved.append(os.path.relpath(fname, ROOT))
+        return original_savefig(self, fname, *args, **kwargs)
+
+    def recording_write(path, data):
+        saved.append(os.path.relpath(path, ROOT))
+        return original_write(path, data)
+
+    def recording_keep(path):
+        saved.append(os.path.relpath(path, ROOT))
+
+    Figure.savefig = recording_savefig
+    chart_output.write_atomic = recording_write
+    chart_output.keep_existing = recording_keep
+    try:
+        module = _load_script(script)
+        func = getattr(module, func_name)
+        mapping = {f.__name__: filename for filename, _, f in getattr(module, "VISUALIZATIONS", [])}
+        if func_name in mapping:
+            module.render(mapping[func_name], func)
+        else:
+            result = func()
+            if isinstance(result, Figure):
+                raise RuntimeError(f"{func_name} returned a figure but has no VISUALIZATIONS entry")
+    finally:
+        Figure.savefig = original_savefig
+        chart_output.write_atomic = original_write
+        chart_output.keep_existing = original_keep
+    return [p.replace(os.sep, "/") for p in dict.fromkeys(saved)]
+
+
+def _worker(task, results, profile=False):
+    name, script, func_name = task
+    start = time.perf_counter()
+    try:
+        if profile:
+            import chart_profile
+            with chart_profile.RenderProfile() as prof:
+                outputs = run_builder(script, func_name)
+            stats = prof.report(outputs, ROOT)
+        else:
+            outputs, stats = run_builder(script, func_name), None
+        results.put((name, "ok", time.perf_counter() - start, outputs, "", stats))
+    except BaseException as e:
+        results.put((name, "failed", time.perf_counter() - start, [], f"{type(e).__name__}: {e}", None))
+
+
+def build(tasks, jobs=None, timeout=300.0, profile=False):
+    """Run tasks with at most `jobs` concurrent processes; returns result rows.
+
+    With profile=True each row also carries a chart_profile report under "profile".
+    """
+    jobs = jobs or os.cpu_count() or 1
+    results = mp.Queue()
+    pending = deque(tasks)
+    running = {}
+    done = {}
+
+    def collect(block_for):
+        try:
+            while True:
+                name, status, seconds, outputs, error, stats = results.get(timeout=block_for)
+                done[name] = {"task": name, "status": status, "seconds": seconds,
+                              "outputs": outputs, "error": error}
+                if stats is not None:
+                    done[name]["profile"] = stats
+                block_for = 0
+        except queue.Empty:
+            pass
+
+    while pending or running:
+        while pending and len(running) < jobs:
+            task = pending.popleft()
+            proc = mp.Process(target=_worker, args=(task, results, profile), daemon=True)
+            proc.start()
+            running[task[0]] = (proc, time.perf_counter())
+
+        collect(0.05)
+
+        for name, (proc, started) in list(running.items()):
+            elapsed = time.perf_counter() - started
+            if name in done:
+                proc.join()
+            elif not proc.is_alive():
+                collect(0.5)
+                if name not in done:
+                    done[name] = {"task": name, "status": "crashed", "seconds": elapsed, "outputs": [],
+                                  "error": f"exit code {proc.exitcode}"}
+            elif elapsed > timeout:
+                proc.terminate()
+                proc.join()
+                done[name] = {"task": name, "status": "timeout", "seconds": elapsed, "outputs": [],
+                              "error": f"exceeded {timeout:.0f}s"}
+            else:
+                continue
+            del running[name]
+
+    return [done[t[0]] for t in tasks]
+
+
+def print_summary(rows, wall_seconds):
+    print()
+    print("=" * 106)
+    print(f"{'Task':<68} {'Status':<8} {'Seconds':>8}  Outputs")
+    print("-" * 106)
+    for row in sorted(rows, key=lambda r: -r["seconds"]):
+        outputs = ", ".join(Path(p).name for p in row["outputs"]) or row["error"]
+        print(f"{row['task']:<68} {row['status']:<8} {row['seconds']:>8.2f}  {outputs}")
+    print("-" * 106)
+    serial = sum(r["seconds"] for r in rows)
+    ok = sum(r["status"] == "ok" for r in rows)
+    print(f"{ok}/{len(rows)} succeeded  |  wall {wall_seconds:.1f}s  |  "
+          f"serial sum {serial:.1f}s  |  speed-up {serial / wall_seconds if wall_seconds else 0:.1f}x")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Render all portfolio charts in parallel")
+    parser.add_argument("--jobs", "-j", type=int, default=None, help="Worker processes (default: CPU count)")
+    parser.add_argument("--timeout", type=float, default=300.0, help="Per-chart timeout in seconds")
+    parser.add_argument("--only", action="append", default=[], help="Only tasks whose name contains this")
+    parser.add_argument("--list", action="store_true", help="List discovered builders and exit")
+    parser.add_argument("--force", action="store_true", help="Rebuild even if the manifest says a chart is current")
+    parser.add_argument("--profile", action="store_true",
+                        help=f"Rebuild and record build/draw/encode time, peak RSS, artists and bytes per chart "
+                             f"to {PROFILE_REPORT.name} (one worker unless --jobs is given)")
+    args = parser.parse_args()
+    if args.profile:
+        # Concurrent workers compete for CPU and skew per-chart timings
+        args.force = True
+        args.jobs = args.jobs or 1
+
+    os.chdir(ROOT)  # regenerate_all_screenshots.py writes relative to the repo root
+    tasks = filter_tasks(discover(), args.only)
+    manifest, hashes, stale = select_stale(tasks, args.force)
+
+    if args.list:
+        for name, _, _ in tasks:
+            state = "stale" if any(t[0] == name for t in stale) else "current"
+            print(f"{name:<68} {state}")
+        return
+
+    print(f"{len(tasks) - len(stale)}/{len(tasks)} charts up to date; "
+          f"building {len(stale)} with {args.jobs or os.cpu_count()} workers...")
+    if not stale:
+        return
+    start = time.perf_counter()
+    rows = build(stale, jobs=args.jobs, timeout=args.timeout, profile=args.profile)
+    print_summary(rows, time.perf_counter() - start)
+    record_results(manifest, rows, hashes)
+    import chart_output  # pyplot and the encode pool are only needed in the parent after the builds
+    chart_output.write_srcset_manifest()
+    import image_placeholders
+    image_placeholders.build()
+    if args.profile:
+        import chart_profile
+        chart_profile.print_table(rows)
+        chart_profile.write_report(rows, PROFILE_REPORT)
+        print(f"\nProfile written to {PROFILE_REPORT.name}")
+    sys.exit(0 if all(r["status"] == "ok" for r in rows) else 1)
+
+
+if __name__ == "__main__":
+    main()
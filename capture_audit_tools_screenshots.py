@@ -9,7 +9,7 @@ from pathlib import Path
 
 try:
     import win32com.client
-    from PIL import ImageGrab, Image
+    from PIL import ImageGrab
     DEPENDENCIES_AVAILABLE = True
 except ImportError:
     DEPENDENCIES_AVAILABLE = False
@@ -209,7 +209,7 @@ def optimize_screenshots():
     print("OPTIMIZING SCREENSHOTS")
     print("=" * 70 + "\n")
 
-    from PIL import Image
+    from optimize_screenshots import encode_webp_to_size, open_for_web
 
     output_dir = Path(r'C:\Users\sorat\Desktop\Coding\portfolio_my\public\images\projects\audit-tools')
     png_files = list(output_dir.glob('*.png'))
@@ -223,38 +223,20 @@ def optimize_screenshots():
     optimized_count = 0
     for png_file in png_files:
         try:
-            # Open image
-            img = Image.open(png_file)
-
-            # Convert to RGB
-            if img.mode in ('RGBA', 'LA'):
-                background = Image.new('RGB', img.size, (255, 255, 255))
-                background.paste(img, mask=img.split()[-1] if 'A' in img.mode else None)
-                img = background
-            elif img.mode != 'RGB':
-                img = img.convert('RGB')
-
-            # Resize if too large
-            if img.width > 1920:
-                ratio = 1920 / img.width
-                new_height = int(img.height * ratio)
-                img = img.resize((1920, new_height), Image.Resampling.LANCZOS)
-                print(f"  Resized {png_file.name} to 1920x{new_height}")
+            # Decode flattened onto white and resized to 1920px in one pass
+            img = open_for_web(png_file, 1920)
+            if img.width == 1920:
+                print(f"  Resized {png_file.name} to 1920x{img.height}")
 
             # Save as WebP
             webp_path = png_file.with_suffix('.webp')
 
-            quality = 85
-            while quality > 50:
-                img.save(webp_path, 'WebP', quality=quality, method=6)
-                file_size_kb = webp_path.stat().st_size / 1024
-
-                if file_size_kb <= 200 or quality <= 55:
-                    print(f"  ✓ {png_file.name} → {webp_path.name} ({file_size_kb:.1f} KB, quality={quality})")
-                    optimized_count += 1
-                    break
-
-                quality -= 5
+            # Highest quality under 200KB, bisected in memory
+            data, quality = encode_webp_to_size(img, 200 * 1024)
+            webp_path.write_bytes(data)
+            file_size_kb = len(data) / 1024
+            print(f"  ✓ {png_file.name} → {webp_path.name} ({file_size_kb:.1f} KB, quality={quality})")
+            optimized_count += 1
 
         except Exception as e:
             print(f"  ✗ Error optimizing {png_file.name}: {e}")
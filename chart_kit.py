@@ -0,0 +1,166 @@
+"""
+Chart Component Library
+Shared palettes, themes and drawing primitives for the portfolio chart
+scripts: KPI cards, themed axes, legends and footers, plus batched table,
+heatmap and timeline components. Scripts build on these instead of
+re-styling every axis, card and footer by hand.
+
+Prepared objects are cached and reused: FontProperties per (size, weight,
+style) and rounded-box paths per (boxstyle, geometry), so a dashboard with a
+dozen identical KPI cards resolves fonts and builds the card outline once.
+Grid-shaped components (tables, heatmaps, timelines) go through the batched
+artists in chart_table.
+"""
+
+from functools import lru_cache
+import matplotlib as mpl
+from matplotlib.collections import LineCollection, PatchCollection
+from matplotlib.font_manager import FontProperties
+from matplotlib.patches import BoxStyle, Circle, PathPatch
+from matplotlib.path import Path
+
+from chart_table import CellBatch, CellBoxes, draw_table
+
+__all__ = [
+    "NAVY", "WHITE", "LIGHT", "SLATE", "BORDER", "AMBER", "GREEN", "INDIGO", "SKY", "ROSE", "ORANGE",
+    "TEAL", "PURPLE", "RISK_COLORS", "DARK_THEME", "LIGHT_THEME", "SLIDE_THEME", "SYNTHETIC_NOTE",
+    "font", "style_axes", "legend", "kpi_card", "footer", "draw_table", "heatmap", "timeline",
+]
+
+# ── Palettes ─────────────────────────────────────────────────────────────────
+
+# Brand palette (DFM IPO readiness infographics)
+NAVY      = "#001F5B"
+WHITE     = "#FFFFFF"
+LIGHT     = "#F1F5F9"
+SLATE     = "#475569"
+BORDER    = "#CBD5E1"
+AMBER     = "#F59E0B"
+GREEN     = "#10B981"
+INDIGO    = "#4F46E5"
+SKY       = "#0EA5E9"
+ROSE      = "#F43F5E"
+ORANGE    = "#F97316"
+TEAL      = "#14B8A6"
+PURPLE    = "#8B5CF6"
+
+# Audit risk ratings
+RISK_COLORS = {"Critical": "#c0392b", "High": "#e67e22",
+               "Medium": "#f1c40f", "Low": "#27ae60"}
+
+# Dashboard themes: figure/panel backgrounds, spine, text, muted text, footer
+DARK_THEME = {"figure": "#0f172a", "panel": "#1e293b", "spine": "#334155",
+              "text": "white", "muted": "#94a3b8", "footer": "#475569"}
+LIGHT_THEME = {"figure": "#f8fafc", "panel": "white", "spine": "#e5e7eb",
+               "text": "#1e3a5f", "muted": "#374151", "footer": "#888"}
+SLIDE_THEME = {"figure": "#1e3a5f", "panel": "#f8fafc", "spine": "#e5e7eb",
+               "text": "white", "muted": "#93c5fd", "footer": "#93c5fd"}
+
+SYNTHETIC_NOTE = "All data is synthetically generated for portfolio demonstration. No real client information."
+
+
+# ── Cached style objects ─────────────────────────────────────────────────────
+
+@lru_cache(maxsize=None)
+def font(size, weight="normal", style="normal"):
+    """Shared FontProperties; Text copies it, so one instance can back many labels"""
+    return FontProperties(size=size, weight=weight, style=style)
+
+
+@lru_cache(maxsize=None)
+def _box_path(boxstyle, x, y, w, h):
+    return BoxStyle(boxstyle)(x, y, w, h, 1.0)
+
+
+# ── Axes & figure styling ────────────────────────────────────────────────────
+
+def style_axes(ax, theme=DARK_THEME):
+    """Panel background, tick, spine, axis-label and title colours in one call.
+
+    Call after setting labels and titles so they pick up the theme colours.
+    """
+    ax.set_facecolor(theme["panel"])
+    ax.tick_params(colors=theme["text"])
+    for spine in ax.spines.values():
+        spine.set_color(theme["spine"])
+    ax.xaxis.label.set_color(theme["muted"])
+    ax.yaxis.label.set_color(theme["muted"])
+    ax.title.set_color(theme["text"])
+    return ax
+
+
+def legend(ax, theme=DARK_THEME, fontsize=8, **kwargs):
+    return ax.legend(facecolor=theme["panel"], labelcolor=theme["text"], fontsize=fontsize, **kwargs)
+
+
+def footer(fig, text=SYNTHETIC_NOTE, theme=LIGHT_THEME, y=0.01, fontsize=7):
+    """Centred italic disclaimer along the bottom of the figure"""
+    return fig.text(0.5, y, text, ha="center", fontsize=fontsize, color=theme["footer"], style="italic")
+
+
+# ── Components ───────────────────────────────────────────────────────────────
+
+def kpi_card(ax, value, label, color, theme=DARK_THEME, *, sub=None, box=(0.05, 0.1, 0.9, 0.8), lw=2,
+             value_size=22, label_size=9, value_y=0.62, label_y=0.28, sub_y=0.18,
+             label_color=None, label_weight="normal"):
+    """Outlined KPI tile: big coloured value over a label (and optional sub-line).
+
+    Turns the whole axes into the card (background = theme panel, axis off).
+    """
+    ax.set_facecolor(theme["panel"])
+    ax.axis("off")
+    ax.add_patch(PathPatch(_box_path("round,pad=0.02", *box), facecolor=theme["panel"],
+                           edgecolor=color, lw=lw, transform=ax.transAxes, clip_on=False))
+    ax.text(0.5, value_y, value, ha="center", va="center", fontproperties=font(value_size, "bold"),
+            color=color, transform=ax.transAxes)
+    ax.text(0.5, label_y, label, ha="center", va="center", fontproperties=font(label_size, label_weight),
+            color=label_color or theme["muted"], transform=ax.transAxes)
+    if sub:
+        ax.text(0.5, sub_y, sub, ha="center", va="center", fontproperties=font(7.5),
+                color="#6b7280", transform=ax.transAxes)
+    return ax
+
+
+def heatmap(ax, values, color_for, *, labels=None, origin=(1, 1), edgecolor="#e5e7eb", lw=0.8,
+            text_color="#9ca3af", fontsize=9, alpha=0.7, zorder=0):
+    """Grid of unit cells centred on integer coordinates, one collection + one text batch.
+
+    values[i][j] is drawn at (origin[0] + j, origin[1] + i) in data coordinates;
+    `color_for(value)` gives the cell colour and `labels` (same shape, default
+    str(value)) the centred label.
+    """
+    x0, y0 = origin
+    rows = [(i, j, v) for i, row in enumerate(values) for j, v in enumerate(row)]
+    paths = [Path([(x0 + j - 0.5, y0 + i - 0.5), (x0 + j + 0.5, y0 + i - 0.5), (x0 + j + 0.5, y0 + i + 0.5),
+                   (x0 + j - 0.5, y0 + i + 0.5), (x0 + j - 0.5, y0 + i - 0.5)], closed=True)
+             for i, j, _ in rows]
+    cells = CellBoxes(paths, facecolors=[color_for(v) for _, _, v in rows], edgecolors=edgecolor,
+                      linewidths=lw, transform=ax.transData, zorder=zorder)
+    ax.add_collection(cells, autolim=False)
+    batch = CellBatch(ax, transform=ax.transData)
+    for i, j, v in rows:
+        batch.text(x0 + j, y0 + i, str(v) if labels is None else labels[i][j], color=text_color,
+                   fontsize=fontsize, alpha=alpha)
+    batch.add_to_axes()
+    return cells
+
+
+def timeline(ax, events, *, x=2, radius=0.3, color="#2563eb", step=2, title_size=11, detail_size=9,
+             title_color=None, detail_color="#6b7280"):
+    """Vertical event timeline in data coordinates.
+
+    `events` is [(y, title, detail)]; markers are one collection, connectors
+    one LineCollection and the two text styles one batch each.
+    """
+    markers = PatchCollection([Circle((x, y), radius) for y, _, _ in events],
+                              facecolors=color, edgecolors=color, zorder=10)
+    ax.add_collection(markers, autolim=False)
+    connectors = [[(x, y - 0.5), (x, y - step - 0.5)] for y, _, _ in events if y > min(e[0] for e in events)]
+    ax.add_collection(LineCollection(connectors, colors="k", linestyles="--", alpha=0.3, linewidths=2),
+                      autolim=False)
+    batch = CellBatch(ax, transform=ax.transData)
+    for y, title, detail in events:
+        batch.text(x + 1, y + 0.2, title, color=title_color or mpl.rcParams["text.color"], fontsize=title_size, fontweight="bold", ha="left")
+        batch.text(x + 1, y - 0.3, detail, color=detail_color, fontsize=detail_size, ha="left")
+    batch.add_to_axes()
+    return markers
@@ -0,0 +1,324 @@
+"""
+Chart Output Stage
+Renders a Matplotlib figure once to an in-memory RGBA raster and encodes
+PNG and WebP from that single raster — no PNG written, re-read and decoded
+from disk. The Agg renderer's buffer is wrapped by PIL without a copy, both
+encodes run concurrently (Pillow releases the GIL while encoding), and each
+output is written atomically via a temp file + rename.
+
+The same raster is also downsampled to responsive widths (480/960/1440/1920
+by default; override with CHART_WIDTHS="480,960", or "" to disable) and
+encoded as WebP and AVIF (when Pillow can write it) next to the PNG
+(name-960w.webp, name-960w.avif). The dpi passed in is a minimum: it is
+raised so the cropped raster is at least as wide as the largest width, and
+variants left over from other widths are removed.
+write_srcset_manifest() indexes those variants into src/data/image-srcset.json
+for the Astro image components.
+
+save_vector_first() is for flat diagrams (boxes, arrows, text): it renders
+the figure as SVG as well as raster, compares gzip-compressed SVG against
+PNG and WebP, publishes the smallest and records the choice in
+src/data/image-formats.json. The PNG is always written as the master copy
+for the screenshot and thumbnail tooling.
+
+Before anything is encoded, the new raster is compared with the PNG already
+on disk: a 64-bit difference hash plus the mean per-channel pixel difference.
+If both are under threshold (CHART_DIFF_THRESHOLD grey levels, default 0.5;
+-1 always rewrites) and every output exists, nothing is re-encoded or
+rewritten, so byte-different but visually identical re-renders (a new
+Matplotlib or FreeType version) keep their bytes, git blobs and CDN entries.
+"""
+
+import glob
+import gzip
+import io
+import json
+import math
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+import numpy as np
+from PIL import Image
+import matplotlib.pyplot as plt
+
+import image_manifest
+from image_manifest import FORMAT_MANIFEST
+from optimize_screenshots import available_formats
+
+_ENCODE_POOL = ThreadPoolExecutor(max_workers=4, thread_name_prefix="chart-encode")
+
+ROOT = Path(__file__).resolve().parent
+PUBLIC_DIR = ROOT / "public"
+SRCSET_MANIFEST = ROOT / "src" / "data" / "image-srcset.json"
+
+RESPONSIVE_WIDTHS = tuple(int(w) for w in os.environ.get("CHART_WIDTHS", "480,960,1440,1920").split(",")
+                          if w.strip())
+RESPONSIVE_FORMATS = {fmt: params for fmt, params in {
+    "avif": {"quality": 60, "speed": 8},
+    "webp": {"quality": 82, "method": 4},
+}.items() if fmt == "webp" or fmt in available_formats()}
+DIFF_THRESHOLD = float(os.environ.get("CHART_DIFF_THRESHOLD", "0.5"))
+HASH_DISTANCE = 2
+_VARIANT = re.compile(r"^(?P<stem>.+)-(?P<width>\d+)w\.(?P<fmt>avif|webp)$")
+
+
+class _RasterCapture:
+    """File-like sink for savefig(format="rgba") that keeps the renderer's
+    memoryview (shape h x w x 4) instead of copying the bytes"""
+
+    def __init__(self):
+        self.buffer = None
+
+    def write(self, data):
+        self.buffer = data
+        return len(data) if hasattr(data, "__len__") else 0
+
+    def seek(self, *args):
+        return 0
+
+    def tell(self):
+        return 0
+
+
+def render_rgba(fig, dpi=130, bbox_inches="tight", facecolor=None):
+    """Render a figure to a PIL RGBA image backed by the Agg buffer"""
+    sink = _RasterCapture()
+    fig.savefig(sink, format="rgba", dpi=dpi, bbox_inches=bbox_inches,
+                facecolor=fig.get_facecolor() if facecolor is None else facecolor)
+    raster = memoryview(sink.buffer)
+    height, width = raster.shape[:2]
+    return Image.frombuffer("RGBA", (width, height), raster, "raw", "RGBA", 0, 1)
+
+
+def encode(img, fmt, **params):
+    """Encode an image to bytes in memory"""
+    buf = io.BytesIO()
+    img.save(buf, fmt, **params)
+    return buf.getvalue()
+
+
+def write_atomic(path, data):
+    """Write bytes to path via a temp file in the same directory, then rename"""
+    path = os.fspath(path)
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "wb") as f:
+        f.write(data)
+    os.replace(tmp, path)
+
+
+def keep_existing(path):
+    """Stands in for write_atomic when an output is left untouched (a hook for build_charts)"""
+
+
+# ── Change detection ─────────────────────────────────────────────────────────
+
+def dhash(img, size=8):
+    """64-bit difference hash: sign of horizontal gradients on a 9x8 greyscale thumbnail"""
+    small = np.asarray(img.convert("L").resize((size + 1, size), Image.Resampling.BILINEAR), dtype=np.int16)
+    bits = (small[:, 1:] > small[:, :-1]).ravel()
+    return int.from_bytes(np.packbits(bits).tobytes(), "big")
+
+
+def visually_unchanged(img, path, threshold=None):
+    """True if the image at `path` looks the same as `img` (same size, close dHash,
+    mean absolute RGB difference under `threshold` grey levels)"""
+    threshold = DIFF_THRESHOLD if threshold is None else threshold
+    if threshold < 0 or not os.path.exists(path):
+        return False
+    try:
+        with Image.open(path) as old:
+            if old.size != img.size:
+                return False
+            old = old.convert("RGB")
+    except OSError:
+        return False
+    new = img.convert("RGB")
+    if bin(dhash(old) ^ dhash(new)).count("1") > HASH_DISTANCE:
+        return False
+    diff = np.abs(np.asarray(old, dtype=np.int16) - np.asarray(new, dtype=np.int16))
+    return float(diff.mean()) <= threshold
+
+
+def _unchanged(img, paths):
+    """Skip check for one output group: all outputs exist and the PNG master looks the same"""
+    paths = list(paths)
+    if not all(os.path.exists(p) for p in paths) or not visually_unchanged(img, paths[0]):
+        return False
+    for path in paths:
+        keep_existing(path)
+    return True
+
+
+# ── Responsive variants ──────────────────────────────────────────────────────
+
+def variant_path(path_png, width, fmt):
+    return f"{os.path.splitext(path_png)[0]}-{width}w.{fmt}"
+
+
+def raster_dpi(fig, dpi, widths=RESPONSIVE_WIDTHS, pad_inches=0.1):
+    """`dpi`, raised so the tight-cropped raster is at least max(widths) pixels wide"""
+    get_renderer = getattr(fig.canvas, "get_renderer", None)
+    if not widths or get_renderer is None:
+        return dpi
+    width_in = fig.get_tightbbox(get_renderer()).width + 2 * pad_inches
+    return max(dpi, math.ceil(max(widths) / width_in) + 1)
+
+
+def _remove_stale_variants(path_png, keep=()):
+    """Delete name-<w>w.<fmt> files of this image that are not in `keep`"""
+    stem = os.path.splitext(path_png)[0]
+    name = os.path.basename(stem)
+    for f in Path(stem).parent.glob(f"{glob.escape(name)}-*w.*"):
+        if (m := _VARIANT.match(f.name)) and m["stem"] == name and str(f) not in keep:
+            f.unlink()
+
+
+def _encode_width(img, path_png, width, formats):
+    """Downsample once to `width` and encode every format from that copy"""
+    height = max(1, round(img.height * width / img.width))
+    small = img if width == img.width else img.resize((width, height), Image.Resampling.LANCZOS,
+                                                      reducing_gap=3.0)
+    return {variant_path(path_png, width, fmt): encode(small, fmt.upper(), **params)
+            for fmt, params in formats.items()}
+
+
+def _variant_widths(img, widths):
+    return sorted({min(w, img.width) for w in widths})
+
+
+def responsive_variants(img, path_png, widths=RESPONSIVE_WIDTHS, formats=RESPONSIVE_FORMATS):
+    """Submit one downsample + multi-format encode per width; returns futures.
+
+    Widths larger than the raster are never upscaled: they collapse into a
+    single variant at the raster's own width.
+    """
+    rgb = img.convert("RGB")  # chart rasters are opaque; dropping alpha shrinks AVIF/WebP
+    return [_ENCODE_POOL.submit(_encode_width, rgb, path_png, w, formats) for w in _variant_widths(rgb, widths)]
+
+
+def save_figure(fig, path_png, dpi=130, webp_quality=88, close=True, facecolor=None,
+                widths=RESPONSIVE_WIDTHS):
+    """Render once, encode PNG, WebP and the responsive variants in parallel and
+    write them all atomically. `webp_quality=None` skips the full-size WebP.
+
+    Returns {path: bytes_written}; empty if the existing files already look
+    the same and were left alone.
+    """
+    img = render_rgba(fig, dpi=raster_dpi(fig, dpi, widths), facecolor=facecolor)
+    expected = [path_png]
+    if webp_quality is not None:
+        expected.append(os.path.splitext(path_png)[0] + ".webp")
+    expected += [variant_path(path_png, w, fmt) for w in _variant_widths(img, widths or ())
+                 for fmt in RESPONSIVE_FORMATS]
+    if _unchanged(img, expected):
+        if close:
+            plt.close(fig)
+        return {}
+    outputs = {path_png: _ENCODE_POOL.submit(encode, img, "PNG", compress_level=6)}
+    if webp_quality is not None:
+        outputs[expected[1]] = _ENCODE_POOL.submit(encode, img, "WEBP", quality=webp_quality)
+    variants = responsive_variants(img, path_png, widths) if widths else []
+    # Finish every encode before touching disk so a failure leaves all files untouched
+    encoded = {path: future.result() for path, future in outputs.items()}
+    for future in variants:
+        encoded.update(future.result())
+    for path, data in encoded.items():
+        write_atomic(path, data)
+    _remove_stale_variants(path_png, encoded)
+    if close:
+        plt.close(fig)
+    return {path: len(data) for path, data in encoded.items()}
+
+
+def write_srcset_manifest(public_dir=PUBLIC_DIR, path=SRCSET_MANIFEST, subdir="images"):
+    """Index every name-<w>w.<fmt> variant under public/<subdir> into a srcset manifest.
+
+    Keys are the public-relative path of the original PNG; each entry holds the
+    intrinsic size of the largest variant and [url, width] pairs per format,
+    smallest first. It is rebuilt from disk, so parallel builders never race on it.
+    """
+    public_dir = Path(public_dir)
+    images = {}
+    for file in sorted((public_dir / subdir).rglob("*w.*")):
+        m = _VARIANT.match(file.name)
+        if not m:
+            continue
+        key = (file.parent / f"{m['stem']}.png").relative_to(public_dir).as_posix()
+        entry = images.setdefault(key, {"sources": {}})
+        entry["sources"].setdefault(m["fmt"], []).append([file.relative_to(public_dir).as_posix(),
+                                                          int(m["width"])])
+    for entry in images.values():
+        for sources in entry["sources"].values():
+            sources.sort(key=lambda s: s[1])
+        largest = max((s for sources in entry["sources"].values() for s in sources), key=lambda s: s[1])
+        with Image.open(public_dir / largest[0]) as im:  # reads the header only
+            entry["width"], entry["height"] = im.size
+    manifest = {"widths": list(RESPONSIVE_WIDTHS), "images": images}
+    write_atomic(path, (json.dumps(manifest, indent=2, sort_keys=True) + "\n").encode("utf-8"))
+    return manifest
+
+
+# ── Vector-first output ──────────────────────────────────────────────────────
+
+def render_svg(fig, bbox_inches="tight", facecolor=None):
+    """Render a figure to SVG bytes with stable ids and no timestamp"""
+    buf = io.BytesIO()
+    with plt.rc_context({"svg.hashsalt": "chart-output"}):
+        fig.savefig(buf, format="svg", bbox_inches=bbox_inches, metadata={"Date": None},
+                    facecolor=fig.get_facecolor() if facecolor is None else facecolor)
+    return buf.getvalue()
+
+
+def save_vector_first(fig, path_png, dpi=130, webp_quality=88, close=True, facecolor=None,
+                      widths=RESPONSIVE_WIDTHS, manifest=FORMAT_MANIFEST):
+    """Publish whichever of SVG, PNG and WebP is smallest once compressed.
+
+    SVG is measured gzipped (as served); PNG and WebP as encoded. The PNG is
+    always written; the SVG or WebP only when it wins, and a stale loser from
+    an earlier build is removed. Responsive raster variants are only written
+    when a raster format wins. Returns the chosen format.
+    """
+    stem = os.path.splitext(path_png)[0]
+    img = render_rgba(fig, dpi=raster_dpi(fig, dpi, widths), facecolor=facecolor)
+    previous = image_manifest.lookup(path_png, manifest)
+    expected = [path_png, str(PUBLIC_DIR / previous["src"])] if previous else []
+    if previous and previous["format"] != "svg" and widths:
+        expected += [variant_path(path_png, w, fmt) for w in _variant_widths(img, widths)
+                     for fmt in RESPONSIVE_FORMATS]
+    if previous and _unchanged(img, expected):
+        if close:
+            plt.close(fig)
+        return previous["format"]
+    rasters = {"png": _ENCODE_POOL.submit(encode, img, "PNG", compress_level=6),
+               "webp": _ENCODE_POOL.submit(encode, img, "WEBP", quality=webp_quality)}
+    # The pool only encodes the already-rendered pixels, so the SVG draw can overlap it;
+    # the figure itself is drawn on this thread only (concurrent draws of one figure are unsafe)
+    encoded = {"svg": render_svg(fig, facecolor=facecolor)}
+    encoded.update((fmt, future.result()) for fmt, future in rasters.items())
+    sizes = {fmt: len(data) for fmt, data in encoded.items()}
+    sizes["svg"] = len(gzip.compress(encoded["svg"], 9, mtime=0))
+    chosen = min(sizes, key=sizes.get)
+
+    outputs = {path_png: encoded["png"]}
+    if chosen != "png":
+        outputs[f"{stem}.{chosen}"] = encoded[chosen]
+    variants = responsive_variants(img, path_png, widths) if widths and chosen != "svg" else []
+    for future in variants:
+        outputs.update(future.result())
+    for path, data in outputs.items():
+        write_atomic(path, data)
+    # An SVG is resolution-independent, so every raster srcset variant goes with it
+    _remove_stale_variants(path_png, outputs)
+    stale = [f"{stem}.{fmt}" for fmt in ("svg", "webp") if fmt != chosen]
+    for path in stale:
+        if os.path.exists(path):
+            os.remove(path)
+    if close:
+        plt.close(fig)
+
+    image_manifest.record(path_png, {"format": chosen, "src": image_manifest.public_path(f"{stem}.{chosen}"),
+                                     "width": img.width, "height": img.height, "bytes": sizes},
+                          manifest=manifest)
+    return chosen
@@ -0,0 +1,166 @@
+"""
+Chart Render Profiler
+Instrumentation for one chart builder run: wall time split into figure build,
+draw and encode, peak RSS, artist count and bytes written. build_charts.py
+wraps each builder in RenderProfile when run with --profile and writes the
+per-chart results to a JSON report plus a sorted console table.
+
+Stages are measured by timing the outermost Figure.savefig /
+chart_output.save_figure / chart_output.save_vector_first call (the output
+stage) and every Figure.draw:
+
+    build  = total - output stage          (data prep, plotting calls)
+    draw   = Figure.draw inside the output stage, incl. bbox_inches="tight"
+    encode = output stage - draw           (PNG/WebP/SVG encode + file write)
+
+Draws triggered by the builder itself (e.g. canvas.draw() for layout) are
+counted in build, not draw.
+"""
+
+import json
+import os
+import time
+from pathlib import Path
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+def peak_rss_mb():
+    """Peak resident set size of this process in MB (None if unavailable)"""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is KB on Linux, bytes on macOS
+    return peak / (1024 * 1024) if os.uname().sysname == "Darwin" else peak / 1024
+
+
+class RenderProfile:
+    """Context manager that patches Matplotlib and chart_output to time one builder"""
+
+    def __init__(self):
+        self.total = 0.0
+        self.output = 0.0
+        self.draw = 0.0
+        self.artists = 0
+        self.figures = 0
+        self.rss_start = None
+        self.rss_peak = None
+        self._depth = 0
+        self._counted = set()
+        self._originals = []
+
+    def _patch(self, owner, name, wrapper_factory):
+        original = getattr(owner, name)
+        self._originals.append((owner, name, original))
+        setattr(owner, name, wrapper_factory(original))
+
+    def _count(self, fig):
+        if id(fig) not in self._counted:
+            self._counted.add(id(fig))
+            self.figures += 1
+            self.artists += sum(1 for _ in fig.findobj())
+
+    def _output_stage(self, original):
+        profile = self
+
+        def wrapper(fig, *args, **kwargs):
+            if profile._depth:
+                return original(fig, *args, **kwargs)
+            profile._count(fig)
+            profile._depth += 1
+            start = time.perf_counter()
+            try:
+                return original(fig, *args, **kwargs)
+            finally:
+                profile.output += time.perf_counter() - start
+                profile._depth -= 1
+        return wrapper
+
+    def _draw(self, original):
+        profile = self
+
+        def wrapper(fig, renderer, *args, **kwargs):
+            if not profile._depth:
+                return original(fig, renderer, *args, **kwargs)
+            start = time.perf_counter()
+            try:
+                return original(fig, renderer, *args, **kwargs)
+            finally:
+                profile.draw += time.perf_counter() - start
+        return wrapper
+
+    def __enter__(self):
+        from matplotlib.figure import Figure
+        import chart_output
+
+        self.rss_start = peak_rss_mb()
+        self._patch(Figure, "savefig", self._output_stage)
+        self._patch(Figure, "draw", self._draw)
+        self._patch(chart_output, "save_figure", self._output_stage)
+        self._patch(chart_output, "save_vector_first", self._output_stage)
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.total = time.perf_counter() - self._start
+        for owner, name, original in reversed(self._originals):
+            setattr(owner, name, original)
+        self._originals.clear()
+        self.rss_peak = peak_rss_mb()
+        return False
+
+    def report(self, outputs=(), root="."):
+        """Result row for this run; `outputs` are paths relative to `root`"""
+        out_bytes = sum(os.path.getsize(Path(root) / p) for p in outputs if (Path(root) / p).exists())
+        return {
+            "total_s": round(self.total, 4),
+            "build_s": round(self.total - self.output, 4),
+            "draw_s": round(self.draw, 4),
+            "encode_s": round(self.output - self.draw, 4),
+            "peak_rss_mb": None if self.rss_peak is None else round(self.rss_peak, 1),
+            "rss_growth_mb": (None if self.rss_peak is None or self.rss_start is None
+                              else round(self.rss_peak - self.rss_start, 1)),
+            "figures": self.figures,
+            "artists": self.artists,
+            "output_bytes": out_bytes,
+        }
+
+
+def write_report(rows, path):
+    """Write profiled rows (build_charts result rows with a 'profile' key) as JSON"""
+    report = {
+        "generated": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "charts": {r["task"]: {"status": r["status"], "outputs": r["outputs"], **r.get("profile", {})}
+                   for r in rows},
+    }
+    tmp = Path(f"{path}.tmp")
+    tmp.write_text(json.dumps(report, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+    os.replace(tmp, path)
+
+
+def print_table(rows, sort_key="total_s"):
+    """Console table of profiled rows, slowest (or largest `sort_key`) first"""
+    profiled = [r for r in rows if r.get("profile")]
+    profiled.sort(key=lambda r: -(r["profile"].get(sort_key) or 0))
+
+    def mb(value):
+        return f"{value:>8.1f}" if value is not None else f"{'n/a':>8}"
+
+    print()
+    print("=" * 122)
+    print(f"{'Task':<60} {'Total':>7} {'Build':>7} {'Draw':>7} {'Encode':>7} "
+          f"{'PeakMB':>8} {'+MB':>8} {'Artists':>8} {'KB':>8}")
+    print("-" * 122)
+    for r in profiled:
+        p = r["profile"]
+        print(f"{r['task'][:60]:<60} {p['total_s']:>7.2f} {p['build_s']:>7.2f} {p['draw_s']:>7.2f} "
+              f"{p['encode_s']:>7.2f} {mb(p['peak_rss_mb'])} {mb(p['rss_growth_mb'])} "
+              f"{p['artists']:>8,} {p['output_bytes'] / 1024:>8.0f}")
+    print("-" * 122)
+    if profiled:
+        totals = {k: sum(r["profile"][k] for r in profiled) for k in ("total_s", "build_s", "draw_s", "encode_s")}
+        print(f"{'Sum':<60} {totals['total_s']:>7.2f} {totals['build_s']:>7.2f} {totals['draw_s']:>7.2f} "
+              f"{totals['encode_s']:>7.2f}")
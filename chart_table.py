@@ -0,0 +1,164 @@
+"""
+Batched Table Renderer
+Draws table cell backgrounds as one PathCollection and cell text as one
+artist per text style, instead of one FancyBboxPatch plus one ax.text per
+cell. A 1,000-row table is a handful of artists rather than ~14,000, so
+building the figure and walking its artists (draw, bbox_inches="tight")
+no longer grows with cell count; only glyph rasterisation does.
+
+The rounded cell boxes are built from the same BoxStyle paths FancyBboxPatch
+uses, and text goes through Matplotlib's own Text layout, so tables look the
+same as the per-cell version.
+"""
+
+import numpy as np
+from matplotlib.artist import Artist, allow_rasterization
+from matplotlib.collections import PathCollection
+from matplotlib.patches import BoxStyle
+from matplotlib.text import Text
+from matplotlib.transforms import Bbox
+
+TEXT_COLOR = "#2d3436"
+HEADER_BG = "#1e3a5f"
+ROW_BGS = ("#ffffff", "#f0f4f8")
+
+
+class CellBoxes(PathCollection):
+    """Cell backgrounds as one collection that still reports its on-screen extent.
+
+    A plain collection in axes coordinates contributes nothing to
+    bbox_inches="tight", which would crop cells drawn with clip_on=False
+    outside the axes; the per-cell patches this replaces did count.
+    """
+
+    def get_window_extent(self, renderer=None):
+        paths = self.get_paths()
+        if not paths:
+            return Bbox.null()
+        vertices = self.get_transform().transform(np.concatenate([p.vertices for p in paths]))
+        return Bbox([vertices.min(axis=0), vertices.max(axis=0)])
+
+
+class TextBatch(Artist):
+    """Many strings sharing one font style, drawn through a single reusable Text"""
+
+    zorder = 3  # same as Text, so batched cell text stays above cell boxes
+
+    def __init__(self, transform, **style):
+        super().__init__()
+        self._template = Text(0, 0, "", transform=transform, clip_on=False, **style)
+        self._items = []
+        self.set_transform(transform)
+        self.set_clip_on(False)
+
+    def set_figure(self, fig):
+        super().set_figure(fig)
+        self._template.set_figure(fig)
+
+    def add(self, x, y, s, color):
+        self._items.append((x, y, s, color))
+        self.stale = True
+
+    def _each(self):
+        t = self._template
+        for x, y, s, color in self._items:
+            t.set_position((x, y))
+            t.set_text(s)
+            t.set_color(color)
+            yield t
+
+    @allow_rasterization
+    def draw(self, renderer):
+        if not self.get_visible():
+            return
+        for t in self._each():
+            t.draw(renderer)
+        self.stale = False
+
+    def get_window_extent(self, renderer=None):
+        boxes = [t.get_window_extent(renderer) for t in self._each() if t.get_text()]
+        return Bbox.union(boxes) if boxes else Bbox.null()
+
+
+class CellBatch:
+    """Collects cell boxes and labels for one Axes and adds them as a few artists.
+
+    Coordinates are in `transform` units (axes fraction by default), exactly
+    as they would be passed to FancyBboxPatch / ax.text.
+    """
+
+    def __init__(self, ax, transform=None):
+        self.ax = ax
+        self.transform = ax.transAxes if transform is None else transform
+        self._boxstyles = {}
+        self._paths = []
+        self._facecolors = []
+        self._edgecolors = []
+        self._linewidths = []
+        self._texts = {}
+
+    def box(self, x, y, w, h, facecolor, edgecolor="black", lw=1.0, boxstyle="round,pad=0.002"):
+        """Rounded cell background; defaults match a bare FancyBboxPatch"""
+        if boxstyle not in self._boxstyles:
+            self._boxstyles[boxstyle] = BoxStyle(boxstyle)
+        self._paths.append(self._boxstyles[boxstyle](x, y, w, h, 1.0))
+        self._facecolors.append(facecolor)
+        self._edgecolors.append(edgecolor)
+        self._linewidths.append(lw)
+
+    def text(self, x, y, s, color=TEXT_COLOR, fontsize=7.5, fontweight="normal",
+             ha="center", va="center", **style):
+        key = (fontsize, fontweight, ha, va, tuple(sorted(style.items())))
+        batch = self._texts.get(key)
+        if batch is None:
+            batch = self._texts[key] = TextBatch(self.transform, fontsize=fontsize, fontweight=fontweight,
+                                                 ha=ha, va=va, **style)
+        batch.add(x, y, s, color)
+
+    def cell(self, x, y, w, h, s, facecolor, edgecolor="black", lw=1.0,
+             boxstyle="round,pad=0.002", **text_style):
+        """Box plus a label centred in it"""
+        self.box(x, y, w, h, facecolor, edgecolor, lw, boxstyle)
+        self.text(x + w / 2, y + h / 2, s, **text_style)
+
+    def add_to_axes(self):
+        """Add the collected cells to the Axes; returns the artists added"""
+        artists = []
+        if self._paths:
+            boxes = CellBoxes(self._paths, facecolors=self._facecolors, edgecolors=self._edgecolors,
+                                   linewidths=self._linewidths, transform=self.transform, clip_on=False)
+            artists.append(self.ax.add_collection(boxes, autolim=False))
+        for batch in self._texts.values():
+            artists.append(self.ax.add_artist(batch))
+        return artists
+
+
+def draw_table(ax, columns, col_widths, rows, *, x=0.02, top=0.85, row_h=0.072, gap=0.005,
+               header_bg=HEADER_BG, row_bgs=ROW_BGS, edgecolor="#ddd", boxstyle="round,pad=0.003",
+               fontsize=7.5, header_fontsize=8, cell_style=None):
+    """Header row plus zebra-striped body rows, batched.
+
+    `cell_style(i, j, value)` may return a dict overriding facecolor, color or
+    fontweight for body cell (i, j). Returns the y of the bottom edge.
+    """
+    cells = CellBatch(ax)
+    cx = x
+    for col, w in zip(columns, col_widths):
+        # Labels centre on the column, boxes are inset by `gap` on the right
+        cells.box(cx, top, w - gap, row_h, header_bg, edgecolor="white", lw=0.5, boxstyle=boxstyle)
+        cells.text(cx + w / 2, top + row_h / 2, col, color="white", fontsize=header_fontsize, fontweight="bold")
+        cx += w
+
+    y = top
+    for i, row in enumerate(rows):
+        y = top - (i + 1) * row_h
+        cx = x
+        for j, (val, w) in enumerate(zip(row, col_widths)):
+            style = {"facecolor": row_bgs[i % len(row_bgs)], "color": TEXT_COLOR, "fontweight": "normal"}
+            if cell_style is not None:
+                style.update(cell_style(i, j, val) or {})
+            cells.box(cx, y, w - gap, row_h, style.pop("facecolor"), edgecolor=edgecolor, lw=0.4, boxstyle=boxstyle)
+            cells.text(cx + w / 2, y + row_h / 2, str(val), fontsize=fontsize, **style)
+            cx += w
+    cells.add_to_axes()
+    return y
@@ -0,0 +1,268 @@
+#!/usr/bin/env python3
+"""
+Screenshot Deduplication Report
+Finds near-duplicate screenshots across the capture directories and the
+published project images (e.g. temp_screenshots_v3/audit_branch_checklist.png
+vs audit-tools/branch-audit-checklist.png, or two finance-dashboard names for
+one capture) and reports how many bytes removing them would reclaim.
+
+Every image is reduced to a 256-bit difference hash in a process pool; the
+hashes go into a BK-tree so each lookup only visits hashes within the
+Hamming radius instead of comparing every pair. Images whose hashes are
+within --distance bits and whose aspect ratios agree are grouped.
+
+Format siblings (x.png, x.webp, x.avif, x-960w.webp) are one image: they
+are hashed once and their bytes count together. In each group the keeper is
+the published copy if there is one, then the largest, then the newest.
+Sources of the screenshot_deploy.json jobs are marked and never counted as
+reclaimable: deleting one would break the next deploy.
+
+With --write-refs, each published duplicate's entry in
+src/data/image-formats.json is replaced by a reference to its keeper
+("duplicate_of" plus the keeper's sources), so pages serve one copy and the
+duplicate files can be deleted.
+
+Usage:
+    python dedup_screenshots.py                      # default directories
+    python dedup_screenshots.py --json dedup.json
+    python dedup_screenshots.py --write-refs
+"""
+
+import argparse
+import glob
+import json
+import os
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import numpy as np
+from PIL import Image
+
+import deploy_screenshots
+import image_manifest
+
+ROOT = Path(__file__).resolve().parent
+DEFAULT_DIRS = ["temp_screenshots", "temp_screenshots_v3", "temp_real_screenshots", "temp_clean_screenshots",
+                "temp_all_screenshots_final", "public/images/projects"]
+EXTENSIONS = (".png", ".webp", ".jpg", ".jpeg", ".avif", ".jxl")
+HASH_SIZE = 16  # 16x16 gradient signs = 256-bit hash
+DISTANCE = 6  # bits; re-encodes of one capture differ by 0-2, different pages of one dashboard by 9+
+ASPECT_TOLERANCE = 0.03
+
+_VARIANT = re.compile(r"-\d+w$")
+
+
+def dhash(path, size=HASH_SIZE):
+    """Difference hash of an image file plus its pixel size: (int hash, (width, height))"""
+    with Image.open(path) as img:
+        width, height = img.size  # before draft(), which shrinks JPEGs
+        img.draft("L", (size * 4, size * 4))
+        if img.mode in ("RGBA", "LA", "P"):
+            img = img.convert("RGBA")
+            background = Image.new("RGBA", img.size, (255, 255, 255, 255))
+            img = Image.alpha_composite(background, img)
+        small = np.asarray(img.convert("L").resize((size + 1, size), Image.Resampling.BOX), dtype=np.int16)
+    bits = (small[:, 1:] > small[:, :-1]).ravel()
+    return int.from_bytes(np.packbits(bits).tobytes(), "big"), (width, height)
+
+
+def _hash_job(path):
+    try:
+        return path, *dhash(path)
+    except OSError as e:
+        return path, None, str(e)
+
+
+class BKTree:
+    """Metric tree over integer hashes with Hamming distance"""
+
+    def __init__(self):
+        self.root = None  # [hash, items, {distance: child}]
+
+    def add(self, value, item):
+        if self.root is None:
+            self.root = [value, [item], {}]
+            return
+        node = self.root
+        while True:
+            d = bin(value ^ node[0]).count("1")
+            if d == 0:
+                node[1].append(item)
+                return
+            if d not in node[2]:
+                node[2][d] = [value, [item], {}]
+                return
+            node = node[2][d]
+
+    def query(self, value, radius):
+        """Items whose hash is within `radius` bits of `value`"""
+        found = []
+        stack = [self.root] if self.root else []
+        while stack:
+            node = stack.pop()
+            d = bin(value ^ node[0]).count("1")
+            if d <= radius:
+                found.extend(node[1])
+            # Triangle inequality: only children at distance d±radius can match
+            stack.extend(child for k, child in node[2].items() if d - radius <= k <= d + radius)
+        return found
+
+
+def collect(dirs):
+    """{(directory, stem): [files]} with format siblings and width variants together"""
+    images = {}
+    for directory in dirs:
+        for path in sorted(Path(directory).rglob("*")):
+            if path.suffix.lower() in EXTENSIONS and path.is_file():
+                stem = _VARIANT.sub("", path.stem)
+                images.setdefault((str(path.parent), stem), []).append(path)
+    return images
+
+
+def deploy_sources(config=deploy_screenshots.CONFIG):
+    """Resolved paths of every source the deploy config reads"""
+    config = deploy_screenshots.load_config(config)
+    return {str(Path(p).resolve()) for pattern in deploy_screenshots.source_patterns(config, list(config["jobs"]))
+            for p in glob.glob(pattern)}
+
+
+def representative(files):
+    """The file to hash: a lossless or at least full-size master if there is one"""
+    order = {ext: i for i, ext in enumerate((".png", ".webp", ".jpg", ".jpeg", ".avif", ".jxl"))}
+    masters = [f for f in files if not _VARIANT.search(f.stem)] or files
+    return min(masters, key=lambda f: order.get(f.suffix.lower(), len(order)))
+
+
+def find_groups(images, distance=DISTANCE, jobs=None, sources=frozenset()):
+    """Hash every image in parallel and group near-duplicates.
+
+    Returns (groups, errors); each group is a list of image records, keeper
+    first. Images with a file in `sources` are marked "deploy_source".
+    """
+    reps = {representative(files): key for key, files in images.items()}
+    records, errors = {}, {}
+    with ProcessPoolExecutor(max_workers=jobs or os.cpu_count() or 1) as pool:
+        for path, value, info in pool.map(_hash_job, reps, chunksize=8):
+            key = reps[path]
+            if value is None:
+                errors[str(path)] = info
+                continue
+            files = images[key]
+            records[key] = {"image": f"{key[0]}/{key[1]}", "hash": value, "size": info,
+                            "files": [str(f) for f in files], "bytes": sum(f.stat().st_size for f in files),
+                            "mtime": max(f.stat().st_mtime for f in files),
+                            "published": image_manifest.public_path(representative(files)) is not None,
+                            "master": str(representative(files)),
+                            "deploy_source": any(str(f.resolve()) in sources for f in files)}
+
+    tree = BKTree()
+    for key, record in records.items():
+        tree.add(record["hash"], key)
+
+    # Union-find over every within-radius pair the tree returns
+    parent = {key: key for key in records}
+
+    def find(key):
+        while parent[key] != key:
+            parent[key] = parent[parent[key]]
+            key = parent[key]
+        return key
+
+    for key, record in records.items():
+        width, height = record["size"]
+        for other in tree.query(record["hash"], distance):
+            ow, oh = records[other]["size"]
+            if other != key and abs(width / height - ow / oh) <= ASPECT_TOLERANCE * width / height:
+                parent[find(other)] = find(key)
+
+    clusters = {}
+    for key in records:
+        clusters.setdefault(find(key), []).append(records[key])
+    groups = [sorted(members, key=lambda r: (not r["published"], -r["size"][0] * r["size"][1], -r["mtime"]))
+              for members in clusters.values() if len(members) > 1]
+    groups.sort(key=lambda g: -sum(r["bytes"] for r in g[1:] if not r["deploy_source"]))
+    return groups, errors
+
+
+def _siblings(record):
+    """Paths an image's format entry may be keyed under: charts record the PNG, screenshots the WebP"""
+    return [f"{record['image']}{ext}" for ext in (".png", ".webp")]
+
+
+def write_refs(groups, manifest=image_manifest.FORMAT_MANIFEST):
+    """Point each published duplicate's format entries at its (published) keeper; returns the count"""
+    count = 0
+    for keeper, *duplicates in groups:
+        if not keeper["published"]:
+            continue
+        entry = next(filter(None, (image_manifest.lookup(p, manifest) for p in _siblings(keeper))), None)
+        if entry is None:
+            fmt = Path(keeper["master"]).suffix[1:].lower()
+            src = image_manifest.public_path(keeper["master"])
+            entry = {"format": fmt, "src": src, "width": keeper["size"][0], "height": keeper["size"][1],
+                     "bytes": {fmt: os.path.getsize(keeper["master"])}, "sources": [[fmt, src]]}
+        ref = {**entry, "duplicate_of": image_manifest.public_path(keeper["master"])}
+        for duplicate in duplicates:
+            if duplicate["published"]:
+                # Replace every entry the page could find first, not just the master's
+                keys = [p for p in _siblings(duplicate) if image_manifest.lookup(p, manifest)] or [duplicate["master"]]
+                for path in keys:
+                    image_manifest.record(path, ref, manifest)
+                count += 1
+    return count
+
+
+def print_report(groups, errors, total_images, seconds):
+    reclaimable = 0
+    for i, (keeper, *duplicates) in enumerate(groups, 1):
+        saved = sum(r["bytes"] for r in duplicates if not r["deploy_source"])
+        reclaimable += saved
+        print(f"\n{i}. {len(duplicates) + 1} copies, {saved / 1024:.0f} KB reclaimable")
+        for record in (keeper, *duplicates):
+            mark = "keep" if record is keeper else f"{bin(record['hash'] ^ keeper['hash']).count('1'):>3}b"
+            where = ("  [published]" if record["published"] else "") + (
+                "  [deploy source]" if record["deploy_source"] else "")
+            print(f"   {mark:>4}  {os.path.relpath(record['image'], ROOT)}  "
+                  f"{record['size'][0]}x{record['size'][1]}  {record['bytes'] / 1024:.0f} KB{where}")
+    for path, error in errors.items():
+        print(f"\n⚠️  Could not read {os.path.relpath(path, ROOT)}: {error}")
+    print("\n" + "=" * 70)
+    print(f"{total_images} images hashed in {seconds:.1f}s; {len(groups)} duplicate group(s), "
+          f"{sum(len(g) - 1 for g in groups)} duplicate(s), {reclaimable / (1024 * 1024):.1f} MB reclaimable")
+    return reclaimable
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Report near-duplicate screenshots across directories")
+    parser.add_argument("dirs", nargs="*", help="Directories to scan (default: capture dirs + public/images/projects)")
+    parser.add_argument("--distance", type=int, default=DISTANCE,
+                        help=f"Max Hamming distance between 256-bit hashes (default {DISTANCE})")
+    parser.add_argument("--workers", "-j", type=int, default=None, help="Worker processes (default: CPU count)")
+    parser.add_argument("--json", type=Path, help="Also write the groups to this JSON file")
+    parser.add_argument("--write-refs", action="store_true",
+                        help="Record published duplicates as references to their keeper in image-formats.json")
+    args = parser.parse_args(argv)
+
+    dirs = args.dirs or [str(ROOT / d) for d in DEFAULT_DIRS if (ROOT / d).is_dir()]
+    print("🔍 Scanning for duplicate screenshots: " + ", ".join(os.path.relpath(d, ROOT) for d in dirs))
+    print("=" * 70)
+    start = time.perf_counter()
+    images = collect(dirs)
+    groups, errors = find_groups(images, args.distance, args.workers, deploy_sources())
+    reclaimable = print_report(groups, errors, len(images), time.perf_counter() - start)
+
+    if args.json:
+        report = {"reclaimable_bytes": reclaimable,
+                  "groups": [[{k: v for k, v in r.items() if k != "hash"} | {"hash": f"{r['hash']:064x}"}
+                              for r in group] for group in groups]}
+        args.json.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+        print(f"Report written to {args.json}")
+    if args.write_refs:
+        print(f"Recorded {write_refs(groups)} published duplicate(s) as references in "
+              f"{os.path.relpath(image_manifest.FORMAT_MANIFEST, ROOT)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,355 @@
+#!/usr/bin/env python3
+"""
+Screenshot Deployment Pipeline
+One config-driven replacement for optimize_screenshots.py,
+optimize_real_screenshots.py, optimize_and_deploy_screenshots.py and
+optimize_and_deploy_all_8.py. screenshot_deploy.json declares jobs: a source
+directory plus either an explicit {source file: "project/name"} mapping or a
+glob pattern, with per-job encoder settings over shared defaults. WebP is
+encoded at a fixed "quality", the best quality within "target_kb", or the
+lowest quality reaching "target_ssim" (see encode_webp_to_ssim).
+
+Each source goes through a stage graph in a worker process:
+
+    decode (reduced-scale where the codec allows) -> flatten alpha onto white
+    and resize in one pass (once per distinct max_width) -> encode (PNG, WebP,
+    AVIF/JXL concurrently) -> write
+
+Captures taller than TILE_HEIGHT are resized and flattened in strips.
+Outputs taller than a job's "page_height" (and always above WebP's 16383px
+limit) are split at quiet rows into stem-p1.webp, stem-p2.webp, ... with
+the whole PNG kept as master; src/data/image-pages.json lists the pages.
+
+A source is decoded exactly once however many targets it feeds, sources run
+in parallel under an in-flight memory budget, and results stream back as
+they finish. Unchanged sources are skipped through optimize_manifest.json;
+with --prune, outputs of the selected jobs' deleted sources are removed and
+dropped from the image manifests. Afterwards the placeholder
+manifest (image_placeholders.py) is brought up to date.
+
+Usage:
+    python deploy_screenshots.py                   # jobs marked "default"
+    python deploy_screenshots.py real v3           # named jobs
+    python deploy_screenshots.py --all             # every job; an output several jobs write
+                                                   # comes from the first of them in the config
+    python deploy_screenshots.py --all --force     # every job, ignore the manifest
+    python deploy_screenshots.py real --prune      # also remove outputs of deleted sources
+    python deploy_screenshots.py --list
+"""
+
+import argparse
+import glob
+import io
+import json
+import os
+import re
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from pathlib import Path
+
+from PIL import Image
+
+import image_manifest
+import image_placeholders
+from image_manifest import PAGES_MANIFEST
+from optimize_manifest import OptimizationManifest
+from optimize_screenshots import (ALT_FORMATS, ScreenshotOptimizer, _estimated_mb, available_formats,
+                                  encode_alternates, encode_webp_to_size, encode_webp_to_ssim, flatten_resize,
+                                  page_breaks, publish_alternates, scaled_size, WEBP_MAX_SIDE)
+
+ROOT = Path(__file__).resolve().parent
+CONFIG = ROOT / "screenshot_deploy.json"
+_PAGE = re.compile(r"-p\d+\.(webp|avif|jxl)$")
+
+
+# ── Plan ─────────────────────────────────────────────────────────────────────
+
+def load_config(path=CONFIG):
+    return json.loads(Path(path).read_text(encoding="utf-8"))
+
+
+def plan(config, names):
+    """Return {source path: [target, ...]} for the selected jobs.
+
+    A target is {"stem", "max_width", "page_height", "png", "webp",
+    "alternates"}; `stem` is
+    the output path without extension. When several selected jobs write the
+    same stem, the job listed first in the config wins (so "all-8", the
+    final capture set, supersedes "real" and "v3") and the others skip it.
+    """
+    defaults = config.get("defaults", {})
+    sources = {}
+    owners = {}
+    for name in sorted(names, key=list(config["jobs"]).index):
+        job = {**defaults, **config["jobs"][name]}
+        source_dir = ROOT / job["source_dir"]
+        dest_dir = ROOT / job["dest_dir"]
+        if "pattern" in job:
+            images = {p.name: p.stem for p in sorted(source_dir.glob(job["pattern"]))}
+        else:
+            images = job["images"]
+        alternates = job["alternates"]
+        if alternates is True:
+            alternates = available_formats()
+        for source_file, dest in images.items():
+            stem = str(dest_dir / dest)
+            if stem in owners:
+                print(f"  ↷ {name}: {dest} skipped, written by {owners[stem]}")
+                continue
+            owners[stem] = name
+            if job["png"] is not None and (source_dir / source_file).resolve() == Path(f"{stem}.png").resolve():
+                raise SystemExit(f"{name}: {source_file} would overwrite its own source; set \"png\": null")
+            sources.setdefault(str(source_dir / source_file), []).append({
+                "stem": stem, "max_width": job["max_width"], "page_height": job.get("page_height"),
+                "png": job["png"], "webp": job["webp"],
+                "alternates": alternates or [],
+            })
+    return sources
+
+
+def source_patterns(config, names):
+    """Path patterns covering every source of the selected jobs, for manifest pruning"""
+    defaults = config.get("defaults", {})
+    patterns = []
+    for name in names:
+        job = {**defaults, **config["jobs"][name]}
+        source_dir = ROOT / job["source_dir"]
+        if "pattern" in job:
+            patterns.append(str(source_dir / job["pattern"]))
+        else:
+            patterns.extend(str(source_dir / glob.escape(f)) for f in job["images"])
+    return patterns
+
+
+# ── Stages (worker process) ──────────────────────────────────────────────────
+
+def _decode(path, max_widths):
+    """Open and load a source, at reduced scale if its codec supports it and every
+    target is downscaled (the largest target still gets at least its width)"""
+    img = Image.open(path)
+    if all(max_widths):
+        img.draft("RGB", scaled_size(img.size, max(max_widths)))
+    img.load()
+    return img
+
+
+def _encode(img, fmt, params):
+    buf = io.BytesIO()
+    img.save(buf, fmt, **params)
+    return buf.getvalue()
+
+
+def _encode_webp(pool, img, webp):
+    """Submit the WebP encode for one image; the future returns (data, quality)"""
+    webp = dict(webp)
+    if "target_kb" in webp:
+        return pool.submit(encode_webp_to_size, img, webp.pop("target_kb") * 1024, **webp)
+    if "target_ssim" in webp:
+        return pool.submit(encode_webp_to_ssim, img, webp.pop("target_ssim"), **webp)
+    return pool.submit(lambda: (_encode(img, "WEBP", webp), webp["quality"]))
+
+
+def _write_atomic(path, data):
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "wb") as f:
+        f.write(data)
+    os.replace(tmp, path)
+
+
+def _remove(paths):
+    for path in paths:
+        if os.path.exists(path):
+            os.remove(path)
+
+
+def _write_image(pool, img, stem, target, png=True):
+    """Encode img as stem.png/.webp plus alternates concurrently, write and publish
+    them; returns (output paths, WebP quality)"""
+    png_future = pool.submit(_encode, img, "PNG", target["png"]) if png and target["png"] is not None else None
+    webp_data, quality = _encode_webp(pool, img, target["webp"]).result()
+    alternates = [pool.submit(encode_alternates, img, quality, [fmt]) for fmt in target["alternates"]]
+    os.makedirs(os.path.dirname(stem), exist_ok=True)
+    outputs = []
+    if png_future is not None:
+        _write_atomic(f"{stem}.png", png_future.result())
+        outputs.append(f"{stem}.png")
+    _write_atomic(f"{stem}.webp", webp_data)
+    outputs.append(f"{stem}.webp")
+    written = publish_alternates(f"{stem}.webp", len(webp_data),
+                                 {fmt: data for future in alternates for fmt, data in future.result().items()}, img.size)
+    return outputs + [str(p) for p in written], quality
+
+
+def _write_pages(pool, img, target, breaks):
+    """Write img as stem-p1, stem-p2, ... (the PNG master stays whole) and record the
+    pages in the page manifest; returns (output paths, WebP qualities)"""
+    stem = target["stem"]
+    outputs, qualities = [], []
+    os.makedirs(os.path.dirname(stem), exist_ok=True)
+    if target["png"] is not None:
+        _write_atomic(f"{stem}.png", pool.submit(_encode, img, "PNG", target["png"]).result())
+        outputs.append(f"{stem}.png")
+    pages = []
+    for number, (top, bottom) in enumerate(zip(breaks, breaks[1:]), 1):
+        page_outputs, quality = _write_image(pool, img.crop((0, top, img.width, bottom)), f"{stem}-p{number}",
+                                             target, png=False)
+        outputs += page_outputs
+        qualities.append(quality)
+        entry = image_manifest.lookup(f"{stem}-p{number}.webp") or {}
+        pages.append({"y": top, "height": bottom - top, "src": entry.get("src"), "sources": entry.get("sources")})
+    image_manifest.record(f"{stem}.png", {"width": img.width, "height": img.height, "pages": pages}, PAGES_MANIFEST)
+    return outputs, qualities
+
+
+def _stale_outputs(stem, paginated):
+    """Files a previous run may have left that the current layout (whole or paged) does
+    not overwrite; pages are always cleared since their count can change"""
+    pages = [p for p in glob.glob(f"{glob.escape(stem)}-p*.*") if _PAGE.search(p)]
+    return pages + [f"{stem}.{fmt}" for fmt in ("webp", *ALT_FORMATS)] if paginated else pages
+
+
+def process_source(source, targets):
+    """Run one source through decode -> flatten/resize -> encode -> write"""
+    timings = {}
+    start = time.perf_counter()
+    widths = {target["max_width"] for target in targets}
+    img = _decode(source, widths)
+    timings["decode"] = time.perf_counter() - start
+
+    t = time.perf_counter()
+    sized = {width: flatten_resize(img, width) for width in widths}
+    del img
+    timings["resize"] = time.perf_counter() - t
+
+    t = time.perf_counter()
+    results = []
+    # Pillow releases the GIL while encoding, so one thread per codec call
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        for target in targets:
+            scaled = sized[target["max_width"]]
+            # WebP cannot encode taller than WEBP_MAX_SIDE, so such captures are always paged
+            page_height = min(target.get("page_height") or WEBP_MAX_SIDE, WEBP_MAX_SIDE)
+            paginated = scaled.height > page_height
+            _remove(_stale_outputs(target["stem"], paginated))
+            if paginated:
+                outputs, qualities = _write_pages(pool, scaled, target, page_breaks(scaled, page_height))
+            else:
+                outputs, quality = _write_image(pool, scaled, target["stem"], target)
+                qualities = [quality]
+                if PAGES_MANIFEST.exists():
+                    image_manifest.record(f"{target['stem']}.png", None, PAGES_MANIFEST)
+            results.append({"stem": target["stem"], "quality": qualities, "outputs": outputs,
+                            "sizes": {o: os.path.getsize(o) for o in outputs}})
+    timings["encode"] = time.perf_counter() - t
+    return {"source": source, "seconds": time.perf_counter() - start, "timings": timings, "targets": results}
+
+
+# ── Driver ───────────────────────────────────────────────────────────────────
+
+def run(sources, jobs=None, max_inflight_mb=1024, force=False, prune=None):
+    """Process `sources` (from plan()); with `prune` (from source_patterns()),
+    also delete outputs of manifest sources matching it that no longer exist"""
+    manifest = OptimizationManifest()
+    settings = {source: {"pipeline": "deploy_screenshots", "targets": targets, "alt_formats": ALT_FORMATS}
+                for source, targets in sources.items()}
+    todo = {}
+    for source, targets in sources.items():
+        if not os.path.exists(source):
+            print(f"  ❌ Missing source: {os.path.relpath(source, ROOT)}")
+        elif force or not manifest.is_current(source, settings[source]):
+            todo[source] = targets
+    print(f"{len(sources) - len(todo)}/{len(sources)} source(s) unchanged; processing {len(todo)}\n")
+
+    jobs = jobs or os.cpu_count() or 1
+    pending = sorted(((_estimated_mb(s, 10 ** 9), s) for s in todo), key=lambda item: -item[0])
+    rows = []
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        in_flight = {}
+        while pending or in_flight:
+            while pending and len(in_flight) < jobs and (
+                    not in_flight or sum(mb for mb, _ in in_flight.values()) + pending[0][0] <= max_inflight_mb):
+                mb, source = pending.pop(0)
+                in_flight[pool.submit(process_source, source, todo[source])] = (mb, source)
+            done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                _, source = in_flight.pop(future)
+                rows.append(_finish(manifest, settings[source], source, future))
+
+    for path in manifest.prune(prune or []):
+        print(f"🗑️  Removed {os.path.relpath(path, ROOT)} (source deleted)")
+    manifest.save()
+    ScreenshotOptimizer.print_report(rows, time.perf_counter() - start)
+    return rows
+
+
+def _finish(manifest, settings, source, future):
+    """Print one finished source and record it; returns a report row"""
+    name = os.path.relpath(source, ROOT)
+    row = {"file": Path(source).name, "ok": False, "seconds": 0.0, "bytes_in": os.path.getsize(source),
+           "bytes_out": 0}
+    try:
+        result = future.result()
+    except Exception as e:
+        print(f"📸 {name}\n  ❌ Error: {e}\n")
+        return row
+    print(f"📸 {name}  ({'  '.join(f'{k} {v:.2f}s' for k, v in result['timings'].items())})")
+    for target in result["targets"]:
+        sizes = "  ".join(f"{Path(o).suffix[1:].upper()} {size / 1024:.0f}KB" for o, size in target["sizes"].items())
+        qualities = target["quality"]
+        quality = f"q{min(qualities)}" + (f"-{max(qualities)}" if max(qualities) > min(qualities) else "")
+        if len(qualities) > 1:
+            quality += f", {len(qualities)} pages"
+        print(f"  ✓ {os.path.relpath(target['stem'], ROOT)}  {sizes}  (WebP {quality})")
+    print()
+    manifest.record(source, settings, [o for t in result["targets"] for o in t["outputs"]])
+    row.update(ok=True, seconds=result["seconds"],
+               bytes_out=sum(_served_bytes(t["sizes"]) for t in result["targets"]))
+    return row
+
+
+def _served_bytes(sizes):
+    """Bytes of the smallest format of one target, summed over its page files"""
+    by_format = {}
+    for output, size in sizes.items():
+        fmt = Path(output).suffix
+        by_format[fmt] = by_format.get(fmt, 0) + size
+    return min(by_format.values())
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Optimize and deploy portfolio screenshots")
+    parser.add_argument("jobs", nargs="*", help="Job names from the config (default: jobs marked default)")
+    parser.add_argument("--all", action="store_true", help="Run every job")
+    parser.add_argument("--config", type=Path, default=CONFIG)
+    parser.add_argument("--workers", "-j", type=int, default=None, help="Worker processes (default: CPU count)")
+    parser.add_argument("--max-inflight-mb", type=int, default=1024,
+                        help="Budget for decoded images in flight across workers")
+    parser.add_argument("--force", action="store_true", help="Re-encode even if the manifest says current")
+    parser.add_argument("--prune", action="store_true",
+                        help="Delete outputs of the selected jobs' sources that no longer exist")
+    parser.add_argument("--list", action="store_true", help="List jobs and exit")
+    args = parser.parse_args(argv)
+
+    config = load_config(args.config)
+    if args.list:
+        for name, job in config["jobs"].items():
+            print(f"{name:<20} {'default' if job.get('default') else '':<8} {job['source_dir']}")
+        return
+    names = list(config["jobs"]) if args.all else args.jobs or [n for n, j in config["jobs"].items() if j.get("default")]
+    unknown = [n for n in names if n not in config["jobs"]]
+    if unknown:
+        sys.exit(f"Unknown job(s): {', '.join(unknown)}")
+
+    print("🖼️  Deploying screenshots: " + ", ".join(names))
+    print("=" * 70)
+    rows = run(plan(config, names), jobs=args.workers, max_inflight_mb=args.max_inflight_mb, force=args.force,
+               prune=source_patterns(config, names) if args.prune else None)
+    computed, total = image_placeholders.build(jobs=args.workers)
+    print(f"Placeholders: {computed} updated, {total} total")
+    sys.exit(0 if all(r["ok"] for r in rows) else 1)
+
+
+if __name__ == "__main__":
+    main()
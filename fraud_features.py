@@ -0,0 +1,207 @@
+"""
+Incremental Rolling-Window Fraud Feature Store
+Keeps 7/30/90-day void rate, discount rate and check count per manager and
+per store. Each new daily transaction file is reduced to (entity, day)
+buckets and folded into running window sums: new days are added, days that
+fall out of a window are subtracted, so an update costs O(new rows) plus the
+expired buckets — history is never reprocessed. State is persisted between
+runs as CSV/JSON under the state directory.
+"""
+
+import json
+import os
+from pathlib import Path
+import numpy as np
+import pandas as pd
+
+WINDOWS = (7, 30, 90)
+METRICS = ["checks", "void_checks", "discount_pct_sum", "sales"]
+KEY = ["kind", "entity"]
+
+
+def _atomic_write(path, write):
+    """Write via a temp file and rename so a crash never leaves half a state file"""
+    tmp = path.with_name(path.name + ".tmp")
+    write(tmp)
+    os.replace(tmp, path)
+
+
+def _day_to_iso(day):
+    return str(np.datetime64(int(day), "D"))
+
+
+def _iso_to_day(value):
+    return int(np.datetime64(value, "D").astype(np.int64))
+
+
+class FeatureStore:
+    """Rolling-window behavioural features per manager and store"""
+
+    def __init__(self, state_dir="data/feature_store", windows=WINDOWS,
+                 date_col="OpenDate", store_col="Store Name", manager_col="Manager",
+                 void_col="Void Count", discount_col="Discount %", sales_col="Sales (AED)"):
+        self.state_dir = Path(state_dir)
+        self.windows = tuple(sorted(windows))
+        self.date_col = date_col
+        self.entity_cols = {"store": store_col, "manager": manager_col}
+        self.void_col = void_col
+        self.discount_col = discount_col
+        self.sales_col = sales_col
+
+        self.as_of = None          # latest day seen (days since epoch)
+        self.ingested = []         # source files already folded in
+        self._buckets = {}         # day -> DataFrame[KEY] of METRICS
+        self._sums = {w: self._empty() for w in self.windows}
+
+    @staticmethod
+    def _empty():
+        index = pd.MultiIndex.from_arrays([[], []], names=KEY)
+        return pd.DataFrame(0.0, index=index, columns=METRICS)
+
+    # ── Ingest ───────────────────────────────────────────────────────────────
+
+    def _daily(self, df):
+        """Reduce raw transactions to per-(kind, entity, day) metric buckets"""
+        days = pd.to_datetime(df[self.date_col], errors="coerce").to_numpy().astype("datetime64[D]")
+        base = pd.DataFrame({
+            "day": days.astype(np.int64),
+            "checks": 1.0,
+            "void_checks": (pd.to_numeric(df[self.void_col], errors="coerce").fillna(0) > 0).astype(float).to_numpy(),
+            "discount_pct_sum": pd.to_numeric(df[self.discount_col], errors="coerce").fillna(0).to_numpy(),
+            "sales": pd.to_numeric(df[self.sales_col], errors="coerce").fillna(0).to_numpy(),
+        })
+        valid = ~np.isnat(days)
+        base = base[valid]
+
+        frames = []
+        for kind, col in self.entity_cols.items():
+            if col not in df.columns:
+                continue
+            part = base.assign(kind=kind, entity=df[col].astype(str).to_numpy()[valid])
+            frames.append(part.groupby(KEY + ["day"], sort=False)[METRICS].sum())
+        if not frames:
+            raise ValueError(f"None of the entity columns {list(self.entity_cols.values())} are present")
+        return pd.concat(frames)
+
+    def update(self, df):
+        """Fold a batch of new transactions into the rolling windows"""
+        daily = self._daily(df)
+        if daily.empty:
+            return
+        new_days = daily.index.get_level_values("day")
+        old_as_of = self.as_of
+        new_as_of = int(new_days.max()) if old_as_of is None else max(old_as_of, int(new_days.max()))
+
+        # 1. Expire buckets that slide out of each window as the as-of date advances
+        if old_as_of is not None and new_as_of > old_as_of:
+            for w in self.windows:
+                for day in [d for d in self._buckets if old_as_of - w < d <= new_as_of - w]:
+                    self._sums[w] = self._sums[w].sub(self._buckets[day], fill_value=0)
+
+        # 2. Add the new buckets to every window they fall inside
+        for w in self.windows:
+            inside = daily[new_days > new_as_of - w]
+            if not inside.empty:
+                self._sums[w] = self._sums[w].add(inside.groupby(level=KEY).sum(), fill_value=0)
+
+        # 3. Retain buckets for the longest window, evicting anything older
+        for day, bucket in daily.groupby(level="day"):
+            if day > new_as_of - self.windows[-1]:
+                bucket = bucket.droplevel("day")
+                existing = self._buckets.get(day)
+                self._buckets[day] = bucket if existing is None else existing.add(bucket, fill_value=0)
+        for day in [d for d in self._buckets if d <= new_as_of - self.windows[-1]]:
+            del self._buckets[day]
+
+        for w in self.windows:
+            sums = self._sums[w].clip(lower=0)
+            self._sums[w] = sums[sums["checks"] > 0.5]
+        self.as_of = new_as_of
+
+    def update_csv(self, path, **read_csv_kwargs):
+        """Ingest a daily transaction file once; returns False if already ingested"""
+        name = Path(path).name
+        if name in self.ingested:
+            return False
+        self.update(pd.read_csv(path, **read_csv_kwargs))
+        self.ingested.append(name)
+        return True
+
+    # ── Features ─────────────────────────────────────────────────────────────
+
+    def features(self, kind=None):
+        """Current per-entity feature table (check_count/void_rate/discount_rate per window)"""
+        columns = {}
+        for w in self.windows:
+            sums = self._sums[w]
+            checks = sums["checks"]
+            columns[f"check_count_{w}d"] = checks.round().astype(int)
+            columns[f"void_rate_{w}d"] = (sums["void_checks"] / checks * 100).round(2)
+            columns[f"discount_rate_{w}d"] = (sums["discount_pct_sum"] / checks).round(2)
+        table = pd.DataFrame(columns).fillna(0)
+        table = table.astype({f"check_count_{w}d": int for w in self.windows})
+        if kind is not None and not table.empty:
+            table = table.xs(kind, level="kind")
+        return table
+
+    # ── Persistence ──────────────────────────────────────────────────────────
+
+    def save(self):
+        self.state_dir.mkdir(parents=True, exist_ok=True)
+        meta = {
+            "as_of": None if self.as_of is None else _day_to_iso(self.as_of),
+            "windows": list(self.windows),
+            "ingested": self.ingested,
+        }
+        _atomic_write(self.state_dir / "meta.json",
+                      lambda p: p.write_text(json.dumps(meta, indent=2), encoding="utf-8"))
+
+        buckets = [b.assign(day=_day_to_iso(d)) for d, b in sorted(self._buckets.items())]
+        buckets = pd.concat(buckets).reset_index() if buckets else pd.DataFrame(columns=KEY + METRICS + ["day"])
+        _atomic_write(self.state_dir / "buckets.csv", lambda p: buckets.to_csv(p, index=False))
+
+        sums = [s.assign(window=w) for w, s in self._sums.items()]
+        sums = pd.concat(sums).reset_index()
+        _atomic_write(self.state_dir / "windows.csv", lambda p: sums.to_csv(p, index=False))
+
+    def load(self):
+        """Load persisted state if present; returns self for chaining"""
+        meta_path = self.state_dir / "meta.json"
+        if not meta_path.exists():
+            return self
+        meta = json.loads(meta_path.read_text(encoding="utf-8"))
+        if tuple(meta["windows"]) != self.windows:
+            raise ValueError(f"State in {self.state_dir} was built with windows {meta['windows']}")
+        self.as_of = None if meta["as_of"] is None else _iso_to_day(meta["as_of"])
+        self.ingested = meta["ingested"]
+
+        buckets = pd.read_csv(self.state_dir / "buckets.csv", dtype={"entity": str})
+        self._buckets = {
+            _iso_to_day(day): group.drop(columns="day").set_index(KEY)[METRICS]
+            for day, group in buckets.groupby("day")
+        }
+        sums = pd.read_csv(self.state_dir / "windows.csv", dtype={"entity": str})
+        self._sums = {w: self._empty() for w in self.windows}
+        for w, group in sums.groupby("window"):
+            self._sums[int(w)] = group.drop(columns="window").set_index(KEY)[METRICS]
+        return self
+
+
+if __name__ == "__main__":
+    import sys
+
+    if len(sys.argv) < 2:
+        print("Usage: python fraud_features.py <daily.csv> [<daily.csv> ...]")
+        sys.exit(1)
+
+    store = FeatureStore().load()
+    for path in sys.argv[1:]:
+        status = "ingested" if store.update_csv(path) else "skipped (already ingested)"
+        print(f"  {Path(path).name}: {status}")
+    store.save()
+
+    print(f"\nAs of: {_day_to_iso(store.as_of) if store.as_of is not None else '-'}")
+    managers = store.features("manager")
+    if not managers.empty:
+        print("\nTop managers by 30-day void rate:")
+        print(managers.sort_values("void_rate_30d", ascending=False).head(10).to_string())
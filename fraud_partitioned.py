@@ -0,0 +1,232 @@
+"""
+Partitioned Fraud Analysis
+Shards check data by store (or region) and runs the Benford, rule, anomaly
+and clustering stages for each partition in a process pool, then merges the
+per-partition results. Partitions can be passed in memory or, for large
+groups, written to one CSV per partition so each worker reads only its own
+shard. Wall-clock time for a multi-store group scales with core count.
+"""
+
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+import numpy as np
+import pandas as pd
+from sklearn.cluster import KMeans
+from sklearn.ensemble import IsolationForest
+from sklearn.preprocessing import StandardScaler
+
+from fraud_rules import RuleEngine, DEFAULT_RULES
+
+BENFORD_EXPECTED = np.log10(1 + 1 / np.arange(1, 10))
+
+COLUMNS = {
+    "store": "Store Name",
+    "manager": "Manager",
+    "sales": "Sales (AED)",
+    "discount": "Discount %",
+    "void_count": "Void Count",
+    "void_amount": "Void Amt (AED)",
+}
+STAGES = ["benford", "rules", "anomaly", "clustering"]
+
+
+# ── Partitioning ─────────────────────────────────────────────────────────────
+
+def partition_frame(df, by=COLUMNS["store"]):
+    """Split a DataFrame into (key, partition) pairs in one groupby pass"""
+    return [(str(key), part) for key, part in df.groupby(by, sort=True)]
+
+
+def write_partitions(df, out_dir, by=COLUMNS["store"]):
+    """Write one CSV per partition; returns [(key, path)] for worker-side loading"""
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    paths = []
+    for i, (key, part) in enumerate(partition_frame(df, by)):
+        path = out_dir / f"part-{i:05d}.csv"
+        part.to_csv(path, index=False)
+        paths.append((key, str(path)))
+    return paths
+
+
+# ── Per-partition stages ─────────────────────────────────────────────────────
+
+def benford_counts(amounts):
+    """First-digit counts (1-9) of positive amounts, fully vectorised"""
+    x = np.asarray(amounts, dtype=float)
+    x = x[np.isfinite(x) & (x > 0)]
+    if len(x) == 0:
+        return np.zeros(9, dtype=np.int64)
+    first = (x / 10 ** np.floor(np.log10(x))).astype(int)
+    return np.bincount(np.clip(first, 1, 9), minlength=10)[1:]
+
+
+def detect_anomalies(part, contamination=0.01, random_state=42):
+    """Isolation Forest over check-level behaviour within one partition"""
+    cols = [COLUMNS["sales"], COLUMNS["discount"], COLUMNS["void_amount"]]
+    X = part[cols].apply(pd.to_numeric, errors="coerce").fillna(0).to_numpy()
+    if len(X) < 20:
+        return part.iloc[:0]
+    model = IsolationForest(contamination=contamination, random_state=random_state, n_jobs=1)
+    predictions = model.fit_predict(X)
+    return part[predictions == -1]
+
+
+def store_features(part):
+    """Store-level discount/void ratios that feed the group-wide clustering"""
+    sales = pd.to_numeric(part[COLUMNS["sales"]], errors="coerce").fillna(0)
+    discount = pd.to_numeric(part[COLUMNS["discount"]], errors="coerce").fillna(0) / 100
+    void_amount = pd.to_numeric(part[COLUMNS["void_amount"]], errors="coerce").fillna(0)
+    grouped = pd.DataFrame({
+        "store": part[COLUMNS["store"]].astype(str),
+        "sales": sales,
+        "discount_amount": sales * discount,
+        "void_amount": void_amount,
+        "checks": 1,
+    }).groupby("store").sum()
+    total = grouped["sales"].where(grouped["sales"] > 0)
+    grouped["discount_ratio"] = (grouped["discount_amount"] / total).fillna(0)
+    grouped["void_ratio"] = (grouped["void_amount"] / total).fillna(0)
+    return grouped
+
+
+def analyse_partition(task):
+    """Run every per-partition stage; task is (key, DataFrame-or-CSV-path, rules)"""
+    key, source, rules = task
+    start = time.perf_counter()
+    part = pd.read_csv(source) if isinstance(source, (str, Path)) else source
+
+    timings = {}
+    t = time.perf_counter()
+    benford = benford_counts(part[COLUMNS["sales"]])
+    timings["benford"] = time.perf_counter() - t
+
+    t = time.perf_counter()
+    engine = RuleEngine(rules)
+    flags = engine.flag(part)
+    timings["rules"] = time.perf_counter() - t
+
+    t = time.perf_counter()
+    anomalies = detect_anomalies(part)
+    timings["anomaly"] = time.perf_counter() - t
+
+    t = time.perf_counter()
+    features = store_features(part)
+    timings["clustering"] = time.perf_counter() - t
+
+    return {
+        "key": key,
+        "rows": len(part),
+        "benford": benford,
+        "rule_stats": engine.stats,
+        "flagged": part[flags != ""].assign(Flag=flags[flags != ""]),
+        "anomalies": anomalies,
+        "store_features": features,
+        "timings": timings,
+        "seconds": time.perf_counter() - start,
+        "pid": os.getpid(),
+    }
+
+
+# ── Merge ────────────────────────────────────────────────────────────────────
+
+def _concat(frames, columns):
+    """Concatenate per-partition frames; an empty frame with `columns` when there are none"""
+    return pd.concat(frames, ignore_index=True) if frames else pd.DataFrame(columns=columns)
+
+
+def _merge(results, n_clusters=3):
+    benford = sum((r["benford"] for r in results), np.zeros(9, dtype=np.int64))
+    observed = benford / benford.sum() if benford.sum() else np.zeros(9)
+    expected = BENFORD_EXPECTED * benford.sum()
+    chi_square = float(((benford - expected) ** 2 / np.where(expected > 0, expected, 1)).sum())
+
+    rule_stats = {}
+    for r in results:
+        for name, s in r["rule_stats"].items():
+            agg = rule_stats.setdefault(name, {"hits": 0, "rows": 0, "seconds": 0.0})
+            for field in agg:
+                agg[field] += s[field]
+
+    if results:
+        stores = pd.concat([r["store_features"] for r in results]).groupby(level=0).sum()
+    else:  # no partitions (empty input or a filter that matched nothing)
+        stores = store_features(pd.DataFrame(columns=list(COLUMNS.values())))
+    total = stores["sales"].where(stores["sales"] > 0)
+    stores["discount_ratio"] = (stores["discount_amount"] / total).fillna(0)
+    stores["void_ratio"] = (stores["void_amount"] / total).fillna(0)
+
+    # Cluster on the merged store table: it is tiny (one row per store), so a
+    # single global fit keeps segment labels comparable across partitions.
+    if len(stores) >= n_clusters:
+        X = StandardScaler().fit_transform(stores[["discount_ratio", "void_ratio"]])
+        kmeans = KMeans(n_clusters=n_clusters, random_state=42, n_init=10).fit(X)
+        # Rank clusters by mean combined ratio so 0 = Low, 1 = Medium, 2 = High
+        centre_risk = kmeans.cluster_centers_.sum(axis=1)
+        rank = np.argsort(np.argsort(centre_risk))
+        stores["risk_cluster"] = rank[kmeans.labels_]
+
+    return {
+        "rows": sum(r["rows"] for r in results),
+        "benford_counts": benford,
+        "benford_observed": observed,
+        "benford_chi_square": chi_square,
+        "rule_stats": rule_stats,
+        "flagged": _concat([r["flagged"] for r in results], [*COLUMNS.values(), "Flag"]),
+        "anomalies": _concat([r["anomalies"] for r in results], list(COLUMNS.values())),
+        "stores": stores,
+        "partitions": pd.DataFrame([
+            {"partition": r["key"], "rows": r["rows"], "seconds": r["seconds"], "pid": r["pid"], **r["timings"]}
+            for r in results
+        ], columns=["partition", "rows", "seconds", "pid", *STAGES]).set_index("partition"),
+    }
+
+
+def run_partitioned(partitions, rules=None, max_workers=None):
+    """Analyse [(key, DataFrame-or-path)] partitions in a process pool and merge"""
+    rules = DEFAULT_RULES if rules is None else rules
+    tasks = [(key, source, rules) for key, source in partitions]
+    start = time.perf_counter()
+    if max_workers == 1:
+        results = [analyse_partition(t) for t in tasks]
+    else:
+        # Large partitions first so the pool is not left waiting on a straggler
+        tasks.sort(key=lambda t: -(len(t[1]) if isinstance(t[1], pd.DataFrame) else os.path.getsize(t[1])))
+        with ProcessPoolExecutor(max_workers=max_workers) as pool:
+            results = list(pool.map(analyse_partition, tasks))
+    merged = _merge(results)
+    merged["seconds"] = time.perf_counter() - start
+    return merged
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Partitioned per-store fraud analysis")
+    parser.add_argument("checks", help="Check-level CSV (dashboard schema)")
+    parser.add_argument("--by", default=COLUMNS["store"], help="Partition column (e.g. 'Store Name' or 'Region')")
+    parser.add_argument("--workers", type=int, default=None, help="Process count (default: all cores)")
+    parser.add_argument("--shard-dir", help="Write per-partition CSVs here and let workers read them")
+    args = parser.parse_args()
+
+    data = pd.read_csv(args.checks)
+    parts = write_partitions(data, args.shard_dir, args.by) if args.shard_dir else partition_frame(data, args.by)
+    del data
+
+    print("=" * 70)
+    print("PARTITIONED FRAUD ANALYSIS")
+    print("=" * 70)
+    result = run_partitioned(parts, max_workers=args.workers)
+
+    print(f"\nRows analysed: {result['rows']:,} across {len(result['partitions'])} partitions "
+          f"in {result['seconds']:.2f}s")
+    print(f"Benford chi-square: {result['benford_chi_square']:.2f}")
+    print(f"Rule-flagged checks: {len(result['flagged']):,}")
+    print(f"Anomalous checks: {len(result['anomalies']):,}")
+    if "risk_cluster" in result["stores"]:
+        print("\nStores per risk cluster (0=Low, 2=High):")
+        print(result["stores"]["risk_cluster"].value_counts().sort_index().to_string())
+    print("\nSlowest partitions:")
+    print(result["partitions"].sort_values("seconds", ascending=False).head(10).round(3).to_string())
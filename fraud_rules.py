@@ -0,0 +1,178 @@
+"""
+Declarative Fraud-Flag Rule Engine
+Rules are declared as plain data (column, operator, threshold, per-store
+overrides, any/all combinations) and compiled once into a vectorised
+evaluation plan. Each DataFrame chunk is evaluated in a single pass: rules
+that test the same column share one broadcast comparison, so adding rules
+does not add passes over the data.
+"""
+
+import json
+import time
+import numpy as np
+import pandas as pd
+
+FLAG_LABEL = "[!] Suspicious"
+
+OPERATORS = {
+    ">": np.greater,
+    ">=": np.greater_equal,
+    "<": np.less,
+    "<=": np.less_equal,
+    "==": np.equal,
+    "!=": np.not_equal,
+}
+
+# Default rule set — mirrors the original hardcoded dashboard flag:
+#   (Discount % > 60) | (Void Amt (AED) > 200)
+DEFAULT_RULES = [
+    {"name": "extreme_discount", "column": "Discount %", "op": ">", "threshold": 60},
+    {"name": "high_void_amount", "column": "Void Amt (AED)", "op": ">", "threshold": 200},
+]
+
+
+def load_rules(path):
+    """Load a rule list from a JSON file (a list, or {"rules": [...]})"""
+    with open(path, encoding="utf-8") as f:
+        data = json.load(f)
+    return data["rules"] if isinstance(data, dict) else data
+
+
+class RuleEngine:
+    """Compile declarative rules and evaluate them over DataFrame chunks.
+
+    Leaf rule:
+        {"name", "column", "op", "threshold", "overrides": {store: threshold}}
+    Combination rule:
+        {"name", "all": [rule names]}  or  {"name", "any": [rule names]}
+
+    Every rule contributes to the flag column unless it sets "flag": false
+    (useful for leaves that only exist to feed a combination).
+    """
+
+    def __init__(self, rules=None, store_column="Store Name"):
+        self.rules = list(DEFAULT_RULES if rules is None else rules)
+        self.store_column = store_column
+        self.stats = {}
+        self._compile()
+
+    def _compile(self):
+        """Validate rules and group leaves by (column, operator)"""
+        names = [r["name"] for r in self.rules]
+        if len(set(names)) != len(names):
+            raise ValueError("Rule names must be unique")
+
+        self._groups = {}
+        self._combos = []
+        self._flag_names = []
+        seen = set()
+        for rule in self.rules:
+            name = rule["name"]
+            if "all" in rule or "any" in rule:
+                how = "all" if "all" in rule else "any"
+                parts = rule[how]
+                missing = [p for p in parts if p not in seen]
+                if missing:
+                    raise ValueError(f"Rule '{name}' references undefined rules: {missing}")
+                self._combos.append((name, how, parts))
+            else:
+                if rule.get("op", ">") not in OPERATORS:
+                    raise ValueError(f"Rule '{name}' has unknown operator {rule.get('op')!r}")
+                key = (rule["column"], rule.get("op", ">"))
+                self._groups.setdefault(key, []).append(rule)
+            if rule.get("flag", True):
+                self._flag_names.append(name)
+            seen.add(name)
+            self.stats.setdefault(name, {"hits": 0, "rows": 0, "seconds": 0.0})
+
+        self._uses_overrides = any(
+            r.get("overrides") for group in self._groups.values() for r in group
+        )
+        self._order = names
+
+    def _thresholds(self, group, store_codes, stores):
+        """Build a (rows x rules) threshold matrix, or a 1-D row if no overrides"""
+        defaults = np.array([r["threshold"] for r in group], dtype=float)
+        if store_codes is None or not any(r.get("overrides") for r in group):
+            return defaults[np.newaxis, :]
+
+        # One lookup table per store (plus a trailing row for unknown/NaN
+        # stores, which take code -1), indexed by the factorised store codes.
+        table = np.tile(defaults, (len(stores) + 1, 1))
+        for j, rule in enumerate(group):
+            for store, value in (rule.get("overrides") or {}).items():
+                idx = stores.get_indexer([store])[0]
+                if idx >= 0:
+                    table[idx, j] = value
+        return table[store_codes]
+
+    def evaluate(self, chunk):
+        """Evaluate every rule over a chunk; returns a boolean DataFrame of hits"""
+        n = len(chunk)
+        hits = {}
+
+        store_codes = stores = None
+        if self._uses_overrides and self.store_column in chunk.columns:
+            store_codes, stores = pd.factorize(chunk[self.store_column])
+
+        for (column, op), group in self._groups.items():
+            start = time.perf_counter()
+            values = pd.to_numeric(chunk[column], errors="coerce").to_numpy(dtype=float)
+            thresholds = self._thresholds(group, store_codes, stores)
+            matrix = OPERATORS[op](values[:, np.newaxis], thresholds)
+            elapsed = (time.perf_counter() - start) / len(group)
+            for j, rule in enumerate(group):
+                hits[rule["name"]] = matrix[:, j]
+                self.stats[rule["name"]]["seconds"] += elapsed
+
+        for name, how, parts in self._combos:
+            start = time.perf_counter()
+            stacked = np.column_stack([hits[p] for p in parts])
+            hits[name] = stacked.all(axis=1) if how == "all" else stacked.any(axis=1)
+            self.stats[name]["seconds"] += time.perf_counter() - start
+
+        for name in self._order:
+            self.stats[name]["hits"] += int(hits[name].sum())
+            self.stats[name]["rows"] += n
+
+        return pd.DataFrame({name: hits[name] for name in self._order}, index=chunk.index)
+
+    def flag(self, chunk, label=FLAG_LABEL):
+        """Return the dashboard-style flag column ("[!] Suspicious" or "")"""
+        hits = self.evaluate(chunk)
+        flagged = hits[self._flag_names].to_numpy().any(axis=1)
+        return pd.Series(np.where(flagged, label, ""), index=chunk.index, name="Flag")
+
+    def evaluate_csv(self, path, chunksize=250_000, **read_csv_kwargs):
+        """Stream a CSV through the engine; returns the total flagged row count"""
+        flagged = 0
+        for chunk in pd.read_csv(path, chunksize=chunksize, **read_csv_kwargs):
+            flagged += int((self.flag(chunk) != "").sum())
+        return flagged
+
+    def reset_stats(self):
+        for name in self.stats:
+            self.stats[name] = {"hits": 0, "rows": 0, "seconds": 0.0}
+
+    def report(self):
+        """Print per-rule hit counts and evaluation timings"""
+        print(f"{'Rule':<28} {'Hits':>10} {'Rows':>12} {'Hit %':>7} {'ms':>9}")
+        print("-" * 70)
+        for name in self._order:
+            s = self.stats[name]
+            pct = s["hits"] / s["rows"] * 100 if s["rows"] else 0.0
+            print(f"{name:<28} {s['hits']:>10,} {s['rows']:>12,} {pct:>6.1f}% {s['seconds'] * 1000:>9.2f}")
+
+
+if __name__ == "__main__":
+    import sys
+
+    if len(sys.argv) < 2:
+        print("Usage: python fraud_rules.py <transactions.csv> [rules.json]")
+        sys.exit(1)
+
+    rules = load_rules(sys.argv[2]) if len(sys.argv) > 2 else None
+    engine = RuleEngine(rules)
+    total = engine.evaluate_csv(sys.argv[1])
+    engine.report()
+    print(f"\nFlagged rows: {total:,}")
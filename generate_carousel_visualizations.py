@@ -8,6 +8,8 @@ import matplotlib.patches as mpatches
 from pathlib import Path
 import numpy as np
 
+from chart_output import save_figure
+
 plt.style.use('seaborn-v0_8-whitegrid')
 
 def generate_carousel_library_catalog():
@@ -288,29 +290,34 @@ Perfect for auditors, CFEs, and fraud investigators looking to level up their to
 
     return fig
 
+OUTPUT_DIR = Path(__file__).resolve().parent / 'public' / 'images' / 'projects' / 'carousel-content'
+
+VISUALIZATIONS = [
+    ("content-library-catalog.png", "Content Library Catalog", generate_carousel_library_catalog),
+    ("carousel-sample-pages.png", "Sample Carousel Pages", generate_carousel_sample_page),
+    ("linkedin-post-mockup.png", "LinkedIn Post Mockup", generate_linkedin_mockup)
+]
+
+def render(filename, gen_func):
+    """Build one visualization and save it to OUTPUT_DIR"""
+    OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+    fig = gen_func()
+    output_path = OUTPUT_DIR / filename
+    # PNG, WebP and responsive variants; skipped if the existing files look the same
+    save_figure(fig, output_path, dpi=150, facecolor='white')
+    return output_path
+
 def main():
     """Generate all carousel visualizations"""
 
-    output_dir = Path(r'C:\Users\sorat\Desktop\Coding\portfolio_my\public\images\projects\carousel-content')
-    output_dir.mkdir(parents=True, exist_ok=True)
-
     print("=" * 70)
     print("CAROUSEL CONTENT LIBRARY VISUALIZATION GENERATOR")
     print("=" * 70)
     print()
 
-    visualizations = [
-        ("content-library-catalog.png", "Content Library Catalog", generate_carousel_library_catalog),
-        ("carousel-sample-pages.png", "Sample Carousel Pages", generate_carousel_sample_page),
-        ("linkedin-post-mockup.png", "LinkedIn Post Mockup", generate_linkedin_mockup)
-    ]
-
-    for filename, title, gen_func in visualizations:
+    for filename, title, gen_func in VISUALIZATIONS:
         print(f"Generating: {title}...")
-        fig = gen_func()
-        output_path = output_dir / filename
-        fig.savefig(output_path, dpi=150, bbox_inches='tight', facecolor='white')
-        plt.close(fig)
+        output_path = render(filename, gen_func)
 
         file_size_kb = output_path.stat().st_size / 1024
         print(f"  ✓ Saved: {filename} ({file_size_kb:.1f} KB)")
@@ -319,7 +326,7 @@ def main():
     print("=" * 70)
     print("✅ ALL VISUALIZATIONS GENERATED SUCCESSFULLY!")
     print("=" * 70)
-    print(f"\nOutput directory: {output_dir}")
+    print(f"\nOutput directory: {OUTPUT_DIR}")
 
 if __name__ == '__main__':
     main()
@@ -10,6 +10,9 @@ import numpy as np
 from pathlib import Path
 from datetime import datetime, timedelta
 
+from chart_kit import timeline
+from chart_output import save_vector_first
+
 plt.style.use('seaborn-v0_8-whitegrid')
 
 def generate_evidence_tracker():
@@ -116,18 +119,7 @@ def generate_chain_of_custody():
         (1, 'Filed', 'Evidence Locker', '2024-12-08 16:00'),
     ]
 
-    for y, event, person, timestamp in events:
-        # Event marker
-        circle = plt.Circle((2, y), 0.3, color='#2563eb', zorder=10)
-        ax2.add_patch(circle)
-
-        # Event text
-        ax2.text(3, y+0.2, event, fontweight='bold', fontsize=11, va='center')
-        ax2.text(3, y-0.3, f'{person} | {timestamp}', fontsize=9, va='center', color='#6b7280')
-
-        # Connect line
-        if y > 1:
-            ax2.plot([2, 2], [y-0.5, y-2.5], 'k--', alpha=0.3, linewidth=2)
+    timeline(ax2, [(y, event, f'{person} | {timestamp}') for y, event, person, timestamp in events])
 
     ax2.set_title('Chain of Custody Timeline', fontsize=12, fontweight='bold', pad=10)
 
@@ -376,30 +368,35 @@ def generate_forensic_report():
 
     return fig
 
+OUTPUT_DIR = Path(__file__).resolve().parent / 'public' / 'images' / 'projects' / 'forensic-toolbox'
+
+VISUALIZATIONS = [
+    ("evidence-tracker.png", "Evidence Tracking System", generate_evidence_tracker),
+    ("chain-of-custody.png", "Chain of Custody Report", generate_chain_of_custody),
+    ("fraud-patterns.png", "Fraud Pattern Detection", generate_fraud_pattern_results),
+    ("forensic-report.png", "Forensic Analysis Report", generate_forensic_report)
+]
+
+def render(filename, gen_func):
+    """Build one visualization and save it to OUTPUT_DIR"""
+    OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+    fig = gen_func()
+    output_path = OUTPUT_DIR / filename
+    # Report mockups are mostly text and boxes: publish SVG when it is smaller
+    save_vector_first(fig, output_path, dpi=150, facecolor='white')
+    return output_path
+
 def main():
     """Generate all forensic visualizations"""
 
-    output_dir = Path(r'C:\Users\sorat\Desktop\Coding\portfolio_my\public\images\projects\forensic-toolbox')
-    output_dir.mkdir(parents=True, exist_ok=True)
-
     print("=" * 70)
     print("FORENSIC TOOLBOX VISUALIZATION GENERATOR")
     print("=" * 70)
     print()
 
-    visualizations = [
-        ("evidence-tracker.png", "Evidence Tracking System", generate_evidence_tracker),
-        ("chain-of-custody.png", "Chain of Custody Report", generate_chain_of_custody),
-        ("fraud-patterns.png", "Fraud Pattern Detection", generate_fraud_pattern_results),
-        ("forensic-report.png", "Forensic Analysis Report", generate_forensic_report)
-    ]
-
-    for filename, title, gen_func in visualizations:
+    for filename, title, gen_func in VISUALIZATIONS:
         print(f"Generating: {title}...")
-        fig = gen_func()
-        output_path = output_dir / filename
-        fig.savefig(output_path, dpi=150, bbox_inches='tight', facecolor='white')
-        plt.close(fig)
+        output_path = render(filename, gen_func)
 
         file_size_kb = output_path.stat().st_size / 1024
         print(f"  ✓ Saved: {filename} ({file_size_kb:.1f} KB)")
@@ -408,7 +405,7 @@ def main():
     print("=" * 70)
     print("✅ ALL VISUALIZATIONS GENERATED SUCCESSFULLY!")
     print("=" * 70)
-    print(f"\nOutput directory: {output_dir}")
+    print(f"\nOutput directory: {OUTPUT_DIR}")
 
 if __name__ == '__main__':
     main()
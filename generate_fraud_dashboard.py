@@ -12,6 +12,8 @@ from PIL import Image
 import random
 from datetime import datetime, timedelta
 
+from fraud_rules import RuleEngine, DEFAULT_RULES
+
 np.random.seed(42)
 random.seed(42)
 
@@ -72,9 +74,9 @@ df = pd.DataFrame({
 })
 
 # Flag suspicious rows
-df["Flag"] = (
-    (df["Discount %"] > 60) | (df["Void Amt (AED)"] > 200)
-).map({True: "[!] Suspicious", False: ""})
+rule_engine = RuleEngine(DEFAULT_RULES)
+df["Flag"] = rule_engine.flag(df)
+rule_engine.report()
 
 # --- Build Figure ---
 fig = plt.figure(figsize=(22, 14), facecolor="#1a1f2e")
@@ -12,6 +12,8 @@ from sklearn.ensemble import IsolationForest
 from sklearn.cluster import DBSCAN, KMeans
 from sklearn.preprocessing import StandardScaler
 
+from chart_output import save_figure
+
 # Set style
 plt.style.use('seaborn-v0_8-darkgrid')
 sns.set_palette("husl")
@@ -313,30 +315,35 @@ def generate_fraud_dashboard():
 
     return fig
 
+OUTPUT_DIR = Path(__file__).resolve().parent / 'public' / 'images' / 'projects' / 'fraud-detection'
+
+VISUALIZATIONS = [
+    ("benford-analysis.png", "Benford's Law Analysis", generate_benford_analysis),
+    ("anomaly-detection.png", "ML Anomaly Detection", generate_anomaly_detection),
+    ("clustering-analysis.png", "Store Risk Clustering", generate_clustering_analysis),
+    ("fraud-dashboard.png", "Comprehensive Dashboard", generate_fraud_dashboard)
+]
+
+def render(filename, gen_func):
+    """Build one visualization and save it to OUTPUT_DIR"""
+    OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+    fig = gen_func()
+    output_path = OUTPUT_DIR / filename
+    # PNG, WebP and responsive variants; skipped if the existing files look the same
+    save_figure(fig, output_path, dpi=150, facecolor='white')
+    return output_path
+
 def main():
     """Generate all fraud detection visualizations"""
 
-    output_dir = Path(r'C:\Users\sorat\Desktop\Coding\portfolio_my\public\images\projects\fraud-detection')
-    output_dir.mkdir(parents=True, exist_ok=True)
-
     print("=" * 70)
     print("FRAUD DETECTION VISUALIZATION GENERATOR")
     print("=" * 70)
     print()
 
-    visualizations = [
-        ("benford-analysis.png", "Benford's Law Analysis", generate_benford_analysis),
-        ("anomaly-detection.png", "ML Anomaly Detection", generate_anomaly_detection),
-        ("clustering-analysis.png", "Store Risk Clustering", generate_clustering_analysis),
-        ("fraud-dashboard.png", "Comprehensive Dashboard", generate_fraud_dashboard)
-    ]
-
-    for filename, title, gen_func in visualizations:
+    for filename, title, gen_func in VISUALIZATIONS:
         print(f"Generating: {title}...")
-        fig = gen_func()
-        output_path = output_dir / filename
-        fig.savefig(output_path, dpi=150, bbox_inches='tight', facecolor='white')
-        plt.close(fig)
+        output_path = render(filename, gen_func)
 
         file_size_kb = output_path.stat().st_size / 1024
         print(f"  ✓ Saved: {filename} ({file_size_kb:.1f} KB)")
@@ -345,7 +352,7 @@ def main():
     print("=" * 70)
     print("✅ ALL VISUALIZATIONS GENERATED SUCCESSFULLY!")
     print("=" * 70)
-    print(f"\nOutput directory: {output_dir}")
+    print(f"\nOutput directory: {OUTPUT_DIR}")
     print("\nNext: Optimize to WebP format")
 
 if __name__ == '__main__':
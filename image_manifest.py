@@ -0,0 +1,83 @@
+"""
+Image Format Manifest
+src/data/image-formats.json tells the Astro pages which encodings exist for
+each published image and which one is smallest, so they can serve the best
+file (or a <picture> with one <source> per format) instead of a fixed PNG.
+
+Keys are paths relative to public/ (e.g. "images/projects/x/y.png"); an
+entry holds the chosen "format" and its "src", intrinsic "width"/"height",
+the encoded "bytes" per format and, where several formats are published,
+"sources": [[format, src], ...] smallest first.
+
+src/data/image-pages.json uses the same keys for tall captures published as
+pages: "width"/"height" of the whole image and "pages": [{"y", "height",
+"src", "sources"}, ...] top to bottom.
+
+Chart builders and screenshot optimizers run in parallel processes, so every
+update is a read-merge-write under an exclusive file lock. Kept free of
+Matplotlib so the screenshot tools can use it cheaply.
+"""
+
+import contextlib
+import json
+import os
+from pathlib import Path
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+ROOT = Path(__file__).resolve().parent
+PUBLIC_DIR = ROOT / "public"
+FORMAT_MANIFEST = ROOT / "src" / "data" / "image-formats.json"
+PAGES_MANIFEST = ROOT / "src" / "data" / "image-pages.json"
+
+MIME_TYPES = {"avif": "image/avif", "jxl": "image/jxl", "webp": "image/webp",
+              "png": "image/png", "svg": "image/svg+xml"}
+
+
+def public_path(path, public_dir=PUBLIC_DIR):
+    """Path relative to public/ in URL form, or None if `path` is not published"""
+    try:
+        return Path(path).resolve().relative_to(Path(public_dir).resolve()).as_posix()
+    except ValueError:
+        return None
+
+
+@contextlib.contextmanager
+def _locked(path):
+    """Exclusive lock on path + '.lock' so parallel writers can update one manifest"""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(f"{path}.lock", "w") as lock:
+        if fcntl is not None:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+        yield
+
+
+def lookup(path, manifest=FORMAT_MANIFEST):
+    """The recorded entry for an image, or None"""
+    key = public_path(path)
+    if key is None or not Path(manifest).exists():
+        return None
+    return json.loads(Path(manifest).read_text(encoding="utf-8"))["images"].get(key)
+
+
+def record(path, entry, manifest=FORMAT_MANIFEST):
+    """Merge one image's entry into the manifest (None removes it); ignored for unpublished paths"""
+    key = public_path(path)
+    if key is None:
+        return
+    with _locked(manifest):
+        data = json.loads(Path(manifest).read_text(encoding="utf-8")) if Path(manifest).exists() else {"images": {}}
+        if entry is None:
+            if key not in data["images"]:
+                return
+            del data["images"][key]
+        else:
+            data["images"][key] = entry
+        # Plain temp file + rename: chart_output.write_atomic calls are recorded as chart outputs
+        tmp = Path(f"{manifest}.{os.getpid()}.tmp")
+        tmp.write_text(json.dumps(data, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+        os.replace(tmp, manifest)
@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Image Placeholder Manifest
+Writes src/data/image-placeholders.json so pages can reserve each project
+image's box and paint a blurred preview before the real file loads. For every
+image under public/images/projects it records:
+
+    "width"/"height"  intrinsic size of the full image
+    "color"           dominant colour as #rrggbb (most common of 5 median-cut colours)
+    "placeholder"     data: URI of a WebP at most 16px on its longer side
+
+Keys are paths relative to public/ like the other image manifests. Format
+siblings (x.png, x.webp, x.avif) and responsive variants (x-960w.webp) share
+one entry, computed from the master file. Only images whose master changed
+(mtime or size) since the last run are decoded, in a process pool, so
+calling build() after every chart or screenshot run is cheap.
+
+Usage:
+    python image_placeholders.py            # update the manifest
+    python image_placeholders.py --force    # recompute every entry
+"""
+
+import argparse
+import base64
+import io
+import json
+import os
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from PIL import Image
+
+import image_manifest
+
+ROOT = Path(__file__).resolve().parent
+IMAGES_DIR = ROOT / "public" / "images" / "projects"
+PLACEHOLDER_MANIFEST = ROOT / "src" / "data" / "image-placeholders.json"
+PLACEHOLDER_SIZE = 16
+PLACEHOLDER_QUALITY = 40
+MASTER_ORDER = (".png", ".jpg", ".jpeg", ".webp", ".avif", ".svg")
+
+_VARIANT = re.compile(r"-\d+w$")
+
+
+def masters(images_dir=IMAGES_DIR):
+    """One file per published image: the best master among its format siblings"""
+    found = {}
+    for path in Path(images_dir).rglob("*"):
+        suffix = path.suffix.lower()
+        if suffix in MASTER_ORDER and path.is_file() and not _VARIANT.search(path.stem):
+            key = (str(path.parent), path.stem)
+            if key not in found or MASTER_ORDER.index(suffix) < MASTER_ORDER.index(found[key].suffix.lower()):
+                found[key] = path
+    # SVG-only diagrams have no raster to sample; they are always published with a PNG master
+    return sorted(p for p in found.values() if p.suffix.lower() != ".svg")
+
+
+def placeholder(path, size=PLACEHOLDER_SIZE, quality=PLACEHOLDER_QUALITY):
+    """{"width", "height", "color", "placeholder"} for one image file"""
+    with Image.open(path) as img:
+        width, height = img.size
+        # draft()/reduce inside thumbnail() keep this cheap for large captures
+        img.thumbnail((64, 64), Image.Resampling.BOX)
+        img = img.convert("RGBA")
+    small = Image.alpha_composite(Image.new("RGBA", img.size, (255, 255, 255, 255)), img).convert("RGB")
+
+    palette = small.quantize(colors=5, method=Image.Quantize.MEDIANCUT)
+    _, index = max(palette.getcolors())
+    r, g, b = palette.getpalette()[index * 3:index * 3 + 3]
+
+    small.thumbnail((size, size), Image.Resampling.LANCZOS)
+    buf = io.BytesIO()
+    small.save(buf, "WEBP", quality=quality, method=6)
+    return {
+        "width": width,
+        "height": height,
+        "color": f"#{r:02x}{g:02x}{b:02x}",
+        "placeholder": "data:image/webp;base64," + base64.b64encode(buf.getvalue()).decode("ascii"),
+    }
+
+
+def _placeholder_job(path):
+    try:
+        return path, placeholder(path), None
+    except OSError as e:
+        return path, None, str(e)
+
+
+def build(images_dir=IMAGES_DIR, manifest=PLACEHOLDER_MANIFEST, jobs=None, force=False):
+    """Bring the placeholder manifest up to date; returns (computed, total)"""
+    manifest = Path(manifest)
+    old = json.loads(manifest.read_text(encoding="utf-8"))["images"] if manifest.exists() else {}
+    entries, todo = {}, []
+    for path in masters(images_dir):
+        key = image_manifest.public_path(path)
+        stat = path.stat()
+        entry = old.get(key)
+        if not force and entry and entry.get("stat") == [stat.st_mtime_ns, stat.st_size]:
+            entries[key] = entry
+        else:
+            todo.append(path)
+
+    if todo:
+        with ProcessPoolExecutor(max_workers=jobs or os.cpu_count() or 1) as pool:
+            for path, entry, error in pool.map(_placeholder_job, todo, chunksize=4):
+                if entry is None:
+                    print(f"  ⚠️  {os.path.relpath(path, ROOT)}: {error}")
+                    continue
+                stat = path.stat()
+                entries[image_manifest.public_path(path)] = {**entry, "stat": [stat.st_mtime_ns, stat.st_size]}
+
+    if entries != old:
+        manifest.parent.mkdir(parents=True, exist_ok=True)
+        tmp = Path(f"{manifest}.{os.getpid()}.tmp")
+        tmp.write_text(json.dumps({"images": dict(sorted(entries.items()))}, indent=2) + "\n", encoding="utf-8")
+        os.replace(tmp, manifest)
+    return len(todo), len(entries)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Write blur placeholders for project images")
+    parser.add_argument("--force", action="store_true", help="Recompute every entry")
+    parser.add_argument("--workers", "-j", type=int, default=None, help="Worker processes (default: CPU count)")
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    computed, total = build(jobs=args.workers, force=args.force)
+    print(f"🖼️  Placeholders: {computed} computed, {total - computed} unchanged "
+          f"({time.perf_counter() - start:.1f}s) → {os.path.relpath(PLACEHOLDER_MANIFEST, ROOT)}")
+
+
+if __name__ == "__main__":
+    main()
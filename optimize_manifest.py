@@ -0,0 +1,134 @@
+"""
+Screenshot Optimization Manifest
+Remembers what each optimize/deploy script produced so unchanged screenshots
+are never decoded or re-encoded. optimize_manifest.json maps every source
+image to its content hash, the encoder settings used (plus the Pillow
+version) and the output files with their sizes.
+
+A source is current when its settings match and every recorded output still
+exists with the recorded size. The content hash is only recomputed when the
+source's mtime or size changed, so the usual check is a handful of stat()
+calls; a touched-but-identical file just has its stat refreshed.
+
+prune(patterns) deletes the outputs of sources that match one of the given
+path patterns (the sources of the job being run) and no longer exist,
+unless another live source claims the same output. Their entries are
+dropped here and from the image format and page manifests, so pages never
+point at deleted files. It is opt-in for the callers: a source missing from
+a scratch capture directory must not unpublish images on every run.
+
+Usage:
+    manifest = OptimizationManifest()
+    if not manifest.is_current(src, settings):
+        ... encode ...
+        manifest.record(src, settings, [png_path, webp_path])
+    manifest.prune([f"{capture_dir}/*.png"])   # only when asked to
+    manifest.save()
+"""
+
+import fnmatch
+import hashlib
+import json
+import os
+import re
+from pathlib import Path
+
+import image_manifest
+
+ROOT = Path(__file__).resolve().parent
+MANIFEST = ROOT / "optimize_manifest.json"
+
+
+def file_sha256(path, chunk_size=1 << 20):
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        while chunk := f.read(chunk_size):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def settings_hash(settings):
+    """Stable hash of an encoder-settings dict plus the Pillow version"""
+    import PIL
+    payload = json.dumps({"settings": settings, "pil": PIL.__version__}, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def _key(path):
+    return os.path.abspath(path)
+
+
+class OptimizationManifest:
+    def __init__(self, path=MANIFEST):
+        self.path = Path(path)
+        self.sources = {}
+        if self.path.exists():
+            self.sources = json.loads(self.path.read_text(encoding="utf-8")).get("sources", {})
+        self._dirty = False
+
+    def is_current(self, source, settings):
+        """True if `source` was already optimized with `settings` and its outputs are intact"""
+        entry = self.sources.get(_key(source))
+        if entry is None or entry["settings"] != settings_hash(settings):
+            return False
+        try:
+            stat = os.stat(source)
+        except FileNotFoundError:
+            return False
+        if not all(os.path.exists(p) and os.path.getsize(p) == size for p, size in entry["outputs"].items()):
+            return False
+        if [stat.st_mtime_ns, stat.st_size] == entry["stat"]:
+            return True
+        # Touched or copied without changing content: refresh the stat, keep the outputs
+        if stat.st_size == entry["stat"][1] and file_sha256(source) == entry["sha256"]:
+            entry["stat"] = [stat.st_mtime_ns, stat.st_size]
+            self._dirty = True
+            return True
+        return False
+
+    def record(self, source, settings, outputs):
+        """Store the result of optimizing `source` into the output paths `outputs`"""
+        stat = os.stat(source)
+        self.sources[_key(source)] = {
+            "sha256": file_sha256(source),
+            "stat": [stat.st_mtime_ns, stat.st_size],
+            "settings": settings_hash(settings),
+            "outputs": {_key(p): os.path.getsize(p) for p in outputs},
+        }
+        self._dirty = True
+
+    def prune(self, patterns):
+        """Delete outputs of sources matching `patterns` that no longer exist; returns
+        the paths removed. Only a pattern's file name may hold wildcards; its directory
+        is matched literally."""
+        patterns = [(os.path.dirname(_key(p)), os.path.basename(p)) for p in patterns]
+        gone = [src for src in self.sources if not os.path.exists(src)
+                and any(os.path.dirname(src) == d and fnmatch.fnmatchcase(os.path.basename(src), name)
+                        for d, name in patterns)]
+        live_outputs = {p for src, entry in self.sources.items() if src not in gone for p in entry["outputs"]}
+        removed = []
+        for src in gone:
+            for output in self.sources.pop(src)["outputs"]:
+                if output not in live_outputs and os.path.exists(output):
+                    os.remove(output)
+                    removed.append(output)
+                    self._unpublish(output)
+            self._dirty = True
+        return removed
+
+    @staticmethod
+    def _unpublish(output):
+        """Drop a deleted output from the format manifest, and its image from the page manifest"""
+        if image_manifest.FORMAT_MANIFEST.exists():
+            image_manifest.record(output, None, image_manifest.FORMAT_MANIFEST)
+        if image_manifest.PAGES_MANIFEST.exists():
+            # Pages are keyed by the whole image, stem.png; page files are stem-pN.<fmt>
+            image_manifest.record(re.sub(r"(-p\d+)?\.\w+$", ".png", output), None, image_manifest.PAGES_MANIFEST)
+
+    def save(self):
+        if not self._dirty:
+            return
+        tmp = self.path.with_name(self.path.name + ".tmp")
+        tmp.write_text(json.dumps({"sources": self.sources}, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+        os.replace(tmp, self.path)
+        self._dirty = False
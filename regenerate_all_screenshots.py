@@ -8,19 +8,19 @@ import matplotlib.pyplot as plt
 import matplotlib.patches as mpatches
 import matplotlib.gridspec as gridspec
 from matplotlib.patches import FancyBboxPatch
-from PIL import Image
 import os
 
+from chart_output import save_figure, write_srcset_manifest
+from chart_kit import (RISK_COLORS, DARK_THEME, LIGHT_THEME, SLIDE_THEME,
+                       style_axes, legend, kpi_card, footer, heatmap)
+from chart_table import CellBatch, draw_table
+
 np.random.seed(42)
 OUT = "public/images/projects"
 
 def save(fig, path_png):
-    """Save as PNG then convert to WebP."""
-    fig.savefig(path_png, dpi=130, bbox_inches="tight",
-                facecolor=fig.get_facecolor())
-    img = Image.open(path_png)
-    img.save(path_png.replace(".png", ".webp"), "WEBP", quality=88)
-    plt.close(fig)
+    """Render once in memory and write PNG, WebP and responsive variants from the same raster."""
+    save_figure(fig, path_png, dpi=130, webp_quality=88)
     print(f"  saved {path_png}")
 
 
@@ -44,8 +44,7 @@ def make_risk_assessment_audit_tools():
         ("Late Banking Deposits",        3, 2, "Low"),
         ("License & Permit Compliance",  2, 2, "Low"),
     ]
-    risk_colors = {"Critical": "#c0392b", "High": "#e67e22",
-                   "Medium": "#f1c40f", "Low": "#27ae60"}
+    risk_colors = RISK_COLORS
 
     fig, ax = plt.subplots(figsize=(18, 8), facecolor="#f8fafc")
     ax.set_facecolor("#f8fafc")
@@ -62,39 +61,14 @@ def make_risk_assessment_audit_tools():
     header_bg = "#1e3a5f"
     row_bgs = ["#ffffff", "#f0f4f8"]
 
-    y_start = 0.85
-    row_h = 0.072
-    x = 0.02
+    def priority_cell(i, j, val):
+        if j == 5:
+            return {"facecolor": risk_colors[val], "color": "white"}
 
-    # Header
-    cx = x
-    for col, w in zip(cols, col_widths):
-        ax.add_patch(FancyBboxPatch((cx, y_start), w - 0.005, row_h,
-            boxstyle="round,pad=0.003", facecolor=header_bg, edgecolor="white", lw=0.5,
-            transform=ax.transAxes, clip_on=False))
-        ax.text(cx + w/2, y_start + row_h/2, col, ha="center", va="center",
-                fontsize=8, color="white", fontweight="bold",
-                transform=ax.transAxes)
-        cx += w
-
-    for i, (area, likelihood, impact, priority) in enumerate(risks):
-        score = likelihood * impact
-        y = y_start - (i + 1) * row_h
-        bg = row_bgs[i % 2]
-        cx = x
-        row_vals = [str(i + 1), area, str(likelihood), str(impact),
-                    str(score), priority, _action(priority)]
-        for j, (val, w) in enumerate(zip(row_vals, col_widths)):
-            cell_bg = risk_colors[priority] if j == 5 else bg
-            txt_color = "white" if j == 5 else "#2d3436"
-            ax.add_patch(FancyBboxPatch((cx, y), w - 0.005, row_h,
-                boxstyle="round,pad=0.003", facecolor=cell_bg,
-                edgecolor="#ddd", lw=0.4,
-                transform=ax.transAxes, clip_on=False))
-            ax.text(cx + w/2, y + row_h/2, val, ha="center", va="center",
-                    fontsize=7.5, color=txt_color, transform=ax.transAxes,
-                    wrap=True)
-            cx += w
+    rows = [(i + 1, area, likelihood, impact, likelihood * impact, priority, _action(priority))
+            for i, (area, likelihood, impact, priority) in enumerate(risks)]
+    draw_table(ax, cols, col_widths, rows, x=0.02, top=0.85, row_h=0.072,
+               header_bg=header_bg, row_bgs=row_bgs, cell_style=priority_cell)
 
     # Legend
     legend_elements = [mpatches.Patch(facecolor=color, label=label)
@@ -102,9 +76,7 @@ def make_risk_assessment_audit_tools():
     ax.legend(handles=legend_elements, loc="lower right", fontsize=8,
               title="Risk Level", framealpha=0.9, bbox_to_anchor=(0.98, 0.02))
 
-    fig.text(0.5, 0.01,
-             "All data is synthetically generated for portfolio demonstration. No real client information.",
-             ha="center", fontsize=7, color="#888", style="italic")
+    footer(fig, theme=LIGHT_THEME)
     save(fig, f"{OUT}/audit-tools/risk-assessment.png")
 
 
@@ -173,14 +145,11 @@ def make_branch_checklist():
     col_hdrs = ["Checklist Item", "Max", "Score", "%", "Finding / Note"]
     hdr_bg = "#2c3e50"
 
+    cells = CellBatch(ax)
     for j, (hdr, x0) in enumerate(zip(col_hdrs, col_xs[:-1])):
         w = col_xs[j + 1] - x0 - 0.005
-        ax.add_patch(FancyBboxPatch((x0, y_cur - 0.028), w, 0.028,
-            boxstyle="round,pad=0.002", facecolor=hdr_bg, edgecolor="white", lw=0.4,
-            transform=ax.transAxes, clip_on=False))
-        ax.text(x0 + w/2, y_cur - 0.014, hdr, ha="center", va="center",
-                fontsize=8, color="white", fontweight="bold",
-                transform=ax.transAxes)
+        cells.cell(x0, y_cur - 0.028, w, 0.028, hdr, hdr_bg, edgecolor="white", lw=0.4,
+                   fontsize=8, color="white", fontweight="bold")
 
     y_cur -= 0.034
     row_h = 0.046
@@ -189,38 +158,31 @@ def make_branch_checklist():
 
     for section, items in sections.items():
         # Section header row
-        ax.add_patch(FancyBboxPatch((0.02, y_cur - row_h), 0.96, row_h,
-            boxstyle="round,pad=0.002", facecolor="#1e3a5f",
-            transform=ax.transAxes, clip_on=False))
+        cells.box(0.02, y_cur - row_h, 0.96, row_h, "#1e3a5f")
         sec_max = sum(m for _, m, _, _ in items)
         sec_sc  = sum(s for _, _, s, _ in items)
-        ax.text(0.04, y_cur - row_h/2, f"  {section}  ({sec_sc}/{sec_max})",
-                va="center", fontsize=9, color="white", fontweight="bold",
-                transform=ax.transAxes)
+        cells.text(0.04, y_cur - row_h/2, f"  {section}  ({sec_sc}/{sec_max})",
+                   ha="left", fontsize=9, color="white", fontweight="bold")
         y_cur -= row_h + 0.004
 
         for k, (item, max_s, score_s, note) in enumerate(items):
             pct_i = score_s / max_s * 100
             bg = section_colors[section] if k % 2 == 0 else "#ffffff"
-            ax.add_patch(FancyBboxPatch((0.02, y_cur - row_h + 0.003), 0.96, row_h - 0.004,
-                boxstyle="round,pad=0.002", facecolor=bg, edgecolor="#ddd", lw=0.3,
-                transform=ax.transAxes, clip_on=False))
+            cells.box(0.02, y_cur - row_h + 0.003, 0.96, row_h - 0.004, bg, edgecolor="#ddd", lw=0.3)
             score_color_i = "#27ae60" if pct_i == 100 else "#e67e22" if pct_i >= 70 else "#c0392b"
             vals = [item, str(max_s), str(score_s), f"{pct_i:.0f}%", note or "—"]
             for j, (v, x0) in enumerate(zip(vals, col_xs[:-1])):
                 w = col_xs[j + 1] - x0 - 0.005
                 c = score_color_i if j == 3 else "#2d3436"
                 fw = "bold" if j == 3 else "normal"
-                ax.text(x0 + w/2, y_cur - row_h/2, v, ha="center", va="center",
-                        fontsize=7.5, color=c, fontweight=fw,
-                        transform=ax.transAxes)
+                cells.text(x0 + w/2, y_cur - row_h/2, v, color=c, fontweight=fw)
             y_cur -= row_h
 
         y_cur -= 0.006
+    cells.add_to_axes()
 
-    fig.text(0.5, 0.01,
-             "All branch names, personnel, and scores are synthetically generated for portfolio demonstration.",
-             ha="center", fontsize=7, color="#888", style="italic")
+    footer(fig, "All branch names, personnel, and scores are synthetically generated for portfolio demonstration.",
+           LIGHT_THEME)
     save(fig, f"{OUT}/audit-tools/branch-checklist.png")
 
 
@@ -249,51 +211,35 @@ def make_revenue_assurance():
         ("Total Variance", f"AED {sum(variance):,}", "#f59e0b"),
     ]
     for i, (label, val, color) in enumerate(kpis):
-        ax = fig.add_subplot(gs[0, i])
-        ax.set_facecolor("#1e293b")
-        ax.axis("off")
-        ax.add_patch(FancyBboxPatch((0.05, 0.1), 0.9, 0.8,
-            boxstyle="round,pad=0.02", facecolor="#1e293b",
-            edgecolor=color, lw=2, transform=ax.transAxes, clip_on=False))
-        ax.text(0.5, 0.62, val, ha="center", va="center", fontsize=22,
-                fontweight="bold", color=color, transform=ax.transAxes)
-        ax.text(0.5, 0.28, label, ha="center", va="center", fontsize=9,
-                color="#94a3b8", transform=ax.transAxes)
+        kpi_card(fig.add_subplot(gs[0, i]), val, label, color, DARK_THEME)
 
     # POS vs Received bar chart
     ax1 = fig.add_subplot(gs[1, :2])
-    ax1.set_facecolor("#1e293b")
     x = np.arange(len(months))
     w = 0.35
     ax1.bar(x - w/2, [v/1000 for v in pos_sales],    w, label="POS Sales",          color="#3b82f6", alpha=0.9)
     ax1.bar(x + w/2, [v/1000 for v in agg_received], w, label="Aggregator Received", color="#10b981", alpha=0.9)
-    ax1.set_xticks(x); ax1.set_xticklabels(months, color="white")
-    ax1.set_ylabel("AED (000s)", color="#94a3b8"); ax1.tick_params(colors="white")
-    ax1.set_title("Monthly POS vs Aggregator Revenue", color="white", fontweight="bold")
-    ax1.spines[:].set_color("#334155"); ax1.yaxis.label.set_color("#94a3b8")
-    ax1.legend(facecolor="#1e293b", labelcolor="white", fontsize=8)
-    ax1.set_facecolor("#1e293b")
-    for spine in ax1.spines.values(): spine.set_color("#334155")
+    ax1.set_xticks(x); ax1.set_xticklabels(months)
+    ax1.set_ylabel("AED (000s)")
+    ax1.set_title("Monthly POS vs Aggregator Revenue", fontweight="bold")
+    style_axes(ax1, DARK_THEME)
+    legend(ax1, DARK_THEME)
 
     # Variance + flags
     ax2 = fig.add_subplot(gs[1, 2])
-    ax2.set_facecolor("#1e293b")
     color_bars = ["#ef4444" if v > 5000 else "#f59e0b" for v in variance]
     ax2.bar(months, [v/1000 for v in variance], color=color_bars, alpha=0.9)
     ax2_r = ax2.twinx()
     ax2_r.plot(months, flags, "o--", color="#a78bfa", linewidth=2, label="Fraud Flags")
     ax2_r.set_ylabel("Fraud Flags", color="#a78bfa")
     ax2_r.tick_params(colors="#a78bfa")
-    ax2.set_title("Variance (AED 000s) & Fraud Flags", color="white", fontweight="bold")
-    ax2.set_ylabel("Variance AED (000s)", color="#94a3b8")
-    ax2.tick_params(colors="white")
-    for spine in ax2.spines.values(): spine.set_color("#334155")
-    ax2.set_facecolor("#1e293b")
-    ax2_r.legend(facecolor="#1e293b", labelcolor="white", fontsize=8)
+    ax2.set_title("Variance (AED 000s) & Fraud Flags", fontweight="bold")
+    ax2.set_ylabel("Variance AED (000s)")
+    style_axes(ax2, DARK_THEME)
+    legend(ax2_r, DARK_THEME)
 
-    fig.text(0.5, 0.02,
-             "All figures are synthetically generated for portfolio demonstration. No real client data.",
-             ha="center", fontsize=7, color="#475569", style="italic")
+    footer(fig, "All figures are synthetically generated for portfolio demonstration. No real client data.",
+           DARK_THEME, y=0.02)
     save(fig, f"{OUT}/audit-tools/revenue-assurance.png")
 
 
@@ -325,15 +271,8 @@ def make_presentation_sample():
         ("Assurance\nCoverage", "91%", "#8b5cf6"),
     ]
     for col, (label, val, color) in enumerate(kpis[:3]):
-        ax = fig.add_subplot(gs[0, col])
-        ax.set_facecolor("white"); ax.axis("off")
-        ax.add_patch(FancyBboxPatch((0.05, 0.08), 0.9, 0.84,
-            boxstyle="round,pad=0.02", facecolor="white",
-            edgecolor=color, lw=3, transform=ax.transAxes, clip_on=False))
-        ax.text(0.5, 0.62, val, ha="center", va="center",
-                fontsize=28, fontweight="bold", color=color, transform=ax.transAxes)
-        ax.text(0.5, 0.25, label, ha="center", va="center",
-                fontsize=9, color="#374151", transform=ax.transAxes)
+        kpi_card(fig.add_subplot(gs[0, col]), val, label, color, LIGHT_THEME,
+                 box=(0.05, 0.08, 0.9, 0.84), lw=3, value_size=28, label_y=0.25)
 
     # Findings by severity (pie)
     ax_pie = fig.add_subplot(gs[1, 0])
@@ -401,9 +340,7 @@ def make_presentation_sample():
             cell.set_facecolor(sev_colors.get(sev, "#f9fafb"))
         cell.set_edgecolor("#e5e7eb")
 
-    fig.text(0.5, 0.01,
-             "All data is synthetically generated for portfolio demonstration. No real client information.",
-             ha="center", fontsize=7, color="#93c5fd", style="italic")
+    footer(fig, theme=SLIDE_THEME)
     save(fig, f"{OUT}/audit-tools/presentation-sample.png")
 
 
@@ -429,19 +366,11 @@ def make_ceo_dashboard():
         ("Critical Findings\nOpen", "6",       "#ef4444"),
     ]
     for i, (label, val, color) in enumerate(kpis):
-        ax = fig.add_subplot(gs[0, i])
-        ax.set_facecolor("#1e293b"); ax.axis("off")
-        ax.add_patch(FancyBboxPatch((0.06, 0.1), 0.88, 0.8,
-            boxstyle="round,pad=0.02", facecolor="#1e293b",
-            edgecolor=color, lw=2.5, transform=ax.transAxes, clip_on=False))
-        ax.text(0.5, 0.62, val, ha="center", va="center",
-                fontsize=24, fontweight="bold", color=color, transform=ax.transAxes)
-        ax.text(0.5, 0.25, label, ha="center", va="center",
-                fontsize=9, color="#94a3b8", transform=ax.transAxes)
+        kpi_card(fig.add_subplot(gs[0, i]), val, label, color, DARK_THEME,
+                 box=(0.06, 0.1, 0.88, 0.8), lw=2.5, value_size=24, label_y=0.25)
 
     # Audit completion by domain
     ax1 = fig.add_subplot(gs[1, :2])
-    ax1.set_facecolor("#1e293b")
     domains = ["Finance & AP", "IT & ITGC", "Operations", "HR & Payroll",
                "Supply Chain", "Compliance", "Fraud Risk"]
     pcts    = [100, 75, 83, 100, 60, 90, 100]
@@ -451,14 +380,12 @@ def make_ceo_dashboard():
     for bar, pct in zip(bars, pcts):
         ax1.text(bar.get_width() + 1, bar.get_y() + bar.get_height()/2,
                  f"{pct}%", va="center", color="white", fontsize=8)
-    ax1.set_title("Audit Plan Completion by Domain", color="white", fontweight="bold")
-    ax1.tick_params(colors="white"); ax1.set_xlabel("% Complete", color="#94a3b8")
-    for spine in ax1.spines.values(): spine.set_color("#334155")
-    ax1.set_facecolor("#1e293b")
+    ax1.set_title("Audit Plan Completion by Domain", fontweight="bold")
+    ax1.set_xlabel("% Complete")
+    style_axes(ax1, DARK_THEME)
 
     # Risk exposure trend
     ax2 = fig.add_subplot(gs[1, 2:])
-    ax2.set_facecolor("#1e293b")
     months = ["Sep", "Oct", "Nov", "Dec", "Jan", "Feb"]
     high   = [18, 16, 14, 11, 9, 6]
     med    = [24, 22, 25, 21, 19, 18]
@@ -466,10 +393,9 @@ def make_ceo_dashboard():
     ax2.plot(months, high, "o-", color="#ef4444", linewidth=2, label="Critical/High")
     ax2.fill_between(months, med, alpha=0.3, color="#f59e0b")
     ax2.plot(months, med, "s--", color="#f59e0b", linewidth=2, label="Medium")
-    ax2.set_title("Open Risk Exposure Trend", color="white", fontweight="bold")
-    ax2.tick_params(colors="white"); ax2.legend(facecolor="#1e293b", labelcolor="white", fontsize=8)
-    ax2.set_facecolor("#1e293b")
-    for spine in ax2.spines.values(): spine.set_color("#334155")
+    ax2.set_title("Open Risk Exposure Trend", fontweight="bold")
+    style_axes(ax2, DARK_THEME)
+    legend(ax2, DARK_THEME)
 
     # Top risks table
     ax3 = fig.add_subplot(gs[2, :])
@@ -496,9 +422,7 @@ def make_ceo_dashboard():
             cell.set_text_props(color="#e2e8f0")
             cell.set_edgecolor("#334155")
 
-    fig.text(0.5, 0.02,
-             "All data is synthetically generated for portfolio demonstration. No real client information.",
-             ha="center", fontsize=7, color="#475569", style="italic")
+    footer(fig, theme=DARK_THEME, y=0.02)
     save(fig, f"{OUT}/internal-tracker/ceo-dashboard.png")
 
 
@@ -588,9 +512,7 @@ def make_audit_committee_dashboard():
             cell.set_facecolor(status_colors.get(status, "white"))
         cell.set_edgecolor("#e5e7eb")
 
-    fig.text(0.5, 0.02,
-             "All data is synthetically generated for portfolio demonstration. No real client information.",
-             ha="center", fontsize=7, color="#888", style="italic")
+    footer(fig, theme=LIGHT_THEME, y=0.02)
     save(fig, f"{OUT}/internal-tracker/audit-committee-dashboard.png")
 
 
@@ -606,14 +528,8 @@ def make_risk_assessment_internal_tracker():
                  fontsize=14, fontweight="bold", pad=15, color="#1e3a5f")
 
     # Color zones
-    for i in range(1, 6):
-        for j in range(1, 6):
-            score = i * j
-            c = "#fee2e2" if score >= 15 else "#fef3c7" if score >= 8 else "#dcfce7"
-            ax.add_patch(plt.Rectangle((j - 0.5, i - 0.5), 1, 1,
-                                       facecolor=c, edgecolor="#e5e7eb", lw=0.8, zorder=0))
-            ax.text(j, i, str(score), ha="center", va="center",
-                    fontsize=9, color="#9ca3af", alpha=0.7)
+    heatmap(ax, [[i * j for j in range(1, 6)] for i in range(1, 6)],
+            lambda score: "#fee2e2" if score >= 15 else "#fef3c7" if score >= 8 else "#dcfce7")
 
     # Risk points
     risks = [
@@ -650,9 +566,7 @@ def make_risk_assessment_internal_tracker():
     ax.legend(handles=legend_elements, loc="lower right", fontsize=9, framealpha=0.95)
     ax.grid(False)
 
-    fig.text(0.5, 0.01,
-             "All data is synthetically generated for portfolio demonstration. No real client information.",
-             ha="center", fontsize=7, color="#888", style="italic")
+    footer(fig, theme=LIGHT_THEME)
     save(fig, f"{OUT}/internal-tracker/risk-assessment.png")
 
 
@@ -680,17 +594,9 @@ def make_presentation_executive_summary():
         ("High-Risk\nFindings", "6",       "#ef4444", "Require immediate management action"),
     ]
     for i, (label, val, color, sub) in enumerate(kpi_data):
-        ax = fig.add_subplot(gs[0, i])
-        ax.set_facecolor("#f8fafc"); ax.axis("off")
-        ax.add_patch(FancyBboxPatch((0.04, 0.06), 0.92, 0.88,
-            boxstyle="round,pad=0.02", facecolor="#f8fafc",
-            edgecolor=color, lw=3, transform=ax.transAxes, clip_on=False))
-        ax.text(0.5, 0.68, val, ha="center", va="center",
-                fontsize=30, fontweight="bold", color=color, transform=ax.transAxes)
-        ax.text(0.5, 0.44, label, ha="center", va="center",
-                fontsize=10, color="#374151", fontweight="bold", transform=ax.transAxes)
-        ax.text(0.5, 0.18, sub, ha="center", va="center",
-                fontsize=7.5, color="#6b7280", transform=ax.transAxes)
+        kpi_card(fig.add_subplot(gs[0, i]), val, label, color, SLIDE_THEME, sub=sub,
+                 box=(0.04, 0.06, 0.92, 0.88), lw=3, value_size=30, value_y=0.68,
+                 label_size=10, label_y=0.44, label_color="#374151", label_weight="bold")
 
     # Bottom: findings + bullets
     ax_bar = fig.add_subplot(gs[1, :2])
@@ -725,9 +631,7 @@ def make_presentation_executive_summary():
                     color="#374151", transform=ax_txt.transAxes)
         y_pos -= 0.22
 
-    fig.text(0.5, 0.02,
-             "All data is synthetically generated for portfolio demonstration. No real client information.",
-             ha="center", fontsize=7, color="#93c5fd", style="italic")
+    footer(fig, theme=SLIDE_THEME, y=0.02)
     save(fig, f"{OUT}/internal-tracker/presentation-executive-summary.png")
 
 
@@ -798,13 +702,11 @@ def make_restaurant_audit_checklist():
     row_h = 0.038
     y_cur = 0.935
 
+    cells = CellBatch(ax)
     for j, (hdr, x0) in enumerate(zip(col_hdrs, col_xs[:-1])):
         w = col_xs[j+1] - x0 - 0.005
-        ax.add_patch(FancyBboxPatch((x0, y_cur - row_h), w, row_h,
-            boxstyle="round,pad=0.002", facecolor="#1e3a5f", edgecolor="white", lw=0.3,
-            transform=ax.transAxes, clip_on=False))
-        ax.text(x0 + w/2, y_cur - row_h/2, hdr, ha="center", va="center",
-                fontsize=8, color="white", fontweight="bold", transform=ax.transAxes)
+        cells.cell(x0, y_cur - row_h, w, row_h, hdr, "#1e3a5f", edgecolor="white", lw=0.3,
+                   fontsize=8, color="white", fontweight="bold")
 
     y_cur -= row_h + 0.004
     section_bgs = {"Kitchen & Food Safety": "#dbeafe",
@@ -818,24 +720,17 @@ def make_restaurant_audit_checklist():
     for section, items in checklist.items():
         sec_max = sum(m for _, _, m, _ in items)
         sec_sc  = sum(s for _, _, s, _ in items)
-        ax.add_patch(FancyBboxPatch((0.01, y_cur - row_h), 0.98, row_h,
-            boxstyle="round,pad=0.002", facecolor="#2c3e50",
-            transform=ax.transAxes, clip_on=False))
-        ax.text(0.03, y_cur - row_h/2,
-                f"  {section}  ({sec_sc}/{sec_max}  —  {sec_sc/sec_max*100:.0f}%)",
-                va="center", fontsize=9, color="white", fontweight="bold",
-                transform=ax.transAxes)
+        cells.box(0.01, y_cur - row_h, 0.98, row_h, "#2c3e50")
+        cells.text(0.03, y_cur - row_h/2,
+                   f"  {section}  ({sec_sc}/{sec_max}  —  {sec_sc/sec_max*100:.0f}%)",
+                   ha="left", fontsize=9, color="white", fontweight="bold")
         y_cur -= row_h + 0.003
 
         for k, (item, result, max_s, note) in enumerate(items):
-            pct_i = (max_s and (max_s and 0) or 0) if max_s == 0 else (
-                0 if result == "N" else (int(max_s * 0.6) if result == "P" else max_s)) / max_s * 100
             score_i = 0 if result == "N" else (int(max_s * 0.6) if result == "P" else max_s)
             pct_i = score_i / max_s * 100 if max_s else 0
             bg = section_bgs[section] if k % 2 == 0 else "white"
-            ax.add_patch(FancyBboxPatch((0.01, y_cur - row_h + 0.002), 0.98, row_h - 0.003,
-                boxstyle="round,pad=0.002", facecolor=bg, edgecolor="#ddd", lw=0.3,
-                transform=ax.transAxes, clip_on=False))
+            cells.box(0.01, y_cur - row_h + 0.002, 0.98, row_h - 0.003, bg, edgecolor="#ddd", lw=0.3)
             vals = [item, result_labels[result], str(max_s), str(score_i), f"{pct_i:.0f}%", note or "—"]
             txt_colors = [None, result_colors[result], None, None,
                           result_colors[result], "#6b7280"]
@@ -843,16 +738,14 @@ def make_restaurant_audit_checklist():
                 w = col_xs[j+1] - x0 - 0.005
                 c = txt_colors[j] or "#2d3436"
                 fw = "bold" if j in (1, 4) else "normal"
-                ax.text(x0 + w/2, y_cur - row_h/2, v,
-                        ha="center", va="center", fontsize=7.5,
-                        color=c, fontweight=fw, transform=ax.transAxes)
+                cells.text(x0 + w/2, y_cur - row_h/2, v, color=c, fontweight=fw)
             y_cur -= row_h
 
         y_cur -= 0.005
+    cells.add_to_axes()
 
-    fig.text(0.5, 0.01,
-             "All outlet names, personnel, and data are synthetically generated for portfolio demonstration.",
-             ha="center", fontsize=7, color="#888", style="italic")
+    footer(fig, "All outlet names, personnel, and data are synthetically generated for portfolio demonstration.",
+           LIGHT_THEME)
     save(fig, f"{OUT}/restaurant-audit/audit-checklist.png")
 
 
@@ -979,4 +872,5 @@ if __name__ == "__main__":
     print("[10/10] fraud-cases — fraud-analysis")
     make_fraud_cases_analysis()
 
+    write_srcset_manifest()
     print("\nAll done! Check public/images/projects/ for updated files.")
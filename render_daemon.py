@@ -0,0 +1,220 @@
+"""
+Warm Chart Render Daemon
+A long-lived process that imports Matplotlib, seaborn, pandas, numpy and
+scikit-learn once, primes the font and text-layout caches, and then renders
+chart jobs sent over a local authenticated socket. The CLI side is a thin
+client (stdlib only), so rebuilding a single chart costs rendering time only
+instead of a fresh interpreter plus all the heavy imports.
+
+Jobs use the same discovery, fingerprints and manifest as build_charts.py.
+Each job runs inside matplotlib.rc_context(), so a script's style sheet does
+not leak into the next job, and the repo modules its script imports
+(chart_kit, chart_output, ...) are dropped from sys.modules first, so edits
+to them take effect without restarting the daemon. A job running past
+--timeout is interrupted with SIGALRM (where the platform has it). As in
+build_charts.py, the srcset and placeholder manifests are updated afterwards.
+
+Usage:
+    python render_daemon.py serve &               # start the warm worker
+    python render_daemon.py render dfm            # render stale charts matching 'dfm'
+    python render_daemon.py render --force make_branch_checklist
+    python render_daemon.py render --timeout 60 dfm
+    python render_daemon.py status
+    python render_daemon.py stop
+"""
+
+import argparse
+import contextlib
+import os
+import secrets
+import signal
+import sys
+import time
+from multiprocessing.connection import Client, Listener
+
+import build_charts
+
+ADDRESS = ("127.0.0.1", int(os.environ.get("RENDER_DAEMON_PORT", "6789")))
+KEY_FILE = build_charts.ROOT / ".render_daemon.key"
+
+
+# ── Server ───────────────────────────────────────────────────────────────────
+
+def warm_up():
+    """Import heavy modules and prime font/text caches; returns module names loaded"""
+    loaded = []
+    import matplotlib
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+    from matplotlib import font_manager
+    loaded.append("matplotlib")
+
+    for name in ("numpy", "pandas", "seaborn", "sklearn.ensemble", "sklearn.cluster",
+                 "sklearn.preprocessing", "PIL.Image", "PIL.WebPImagePlugin", "chart_output"):
+        try:
+            __import__(name)
+            loaded.append(name)
+        except ImportError:
+            pass
+
+    for family in ("DejaVu Sans", "sans-serif", "monospace"):
+        font_manager.findfont(font_manager.FontProperties(family=[family]))
+
+    # One throwaway draw builds the Agg text/glyph caches used by every chart
+    fig = plt.figure(figsize=(2, 1))
+    fig.text(0.5, 0.5, "warm-up 0123456789", fontweight="bold", fontfamily="DejaVu Sans")
+    fig.text(0.5, 0.2, "warm-up", fontfamily="monospace", style="italic")
+    fig.canvas.draw()
+    plt.close(fig)
+    return loaded
+
+
+def evict_local_modules(script):
+    """Drop the repo modules `script` imports from sys.modules so the next import rereads them"""
+    paths = {str(p.resolve()) for p in build_charts._local_modules(build_charts.ROOT / script, set())}
+    for name, module in list(sys.modules.items()):
+        path = getattr(module, "__file__", None)
+        if path and os.path.abspath(path) in paths:
+            del sys.modules[name]
+
+
+@contextlib.contextmanager
+def time_limit(seconds):
+    """Raise TimeoutError in the main thread once `seconds` have passed (no-op without SIGALRM)"""
+    if not hasattr(signal, "SIGALRM"):
+        yield
+        return
+
+    def expire(signum, frame):
+        raise TimeoutError(f"exceeded {seconds:.0f}s")
+
+    previous = signal.signal(signal.SIGALRM, expire)
+    signal.setitimer(signal.ITIMER_REAL, seconds)
+    try:
+        yield
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, previous)
+
+
+def render_jobs(only, force, timeout=300.0):
+    """Render stale charts in-process; returns summary rows"""
+    import matplotlib
+    import matplotlib.pyplot as plt
+
+    os.chdir(build_charts.ROOT)
+    tasks = build_charts.filter_tasks(build_charts.discover(), only)
+    manifest, hashes, stale = build_charts.select_stale(tasks, force)
+
+    rows = []
+    for name, script, func_name in stale:
+        evict_local_modules(script)
+        start = time.perf_counter()
+        try:
+            with matplotlib.rc_context(), time_limit(timeout):
+                outputs = build_charts.run_builder(script, func_name)
+            rows.append({"task": name, "status": "ok", "seconds": time.perf_counter() - start,
+                         "outputs": outputs, "error": ""})
+        except TimeoutError as e:
+            rows.append({"task": name, "status": "timeout", "seconds": time.perf_counter() - start,
+                         "outputs": [], "error": str(e)})
+        except Exception as e:
+            rows.append({"task": name, "status": "failed", "seconds": time.perf_counter() - start,
+                         "outputs": [], "error": f"{type(e).__name__}: {e}"})
+        finally:
+            plt.close("all")
+    if rows:
+        build_charts.record_results(manifest, rows, hashes)
+        import chart_output  # the copy the last job loaded
+        chart_output.write_srcset_manifest()
+        import image_placeholders
+        image_placeholders.build()
+    return {"rows": rows, "current": len(tasks) - len(stale)}
+
+
+def serve():
+    start = time.perf_counter()
+    loaded = warm_up()
+    started = time.time()
+    jobs = 0
+    print(f"✓ Warm in {time.perf_counter() - start:.1f}s ({', '.join(loaded)})")
+
+    key = secrets.token_bytes(32)
+    try:
+        with Listener(ADDRESS, authkey=key) as listener:
+            KEY_FILE.write_bytes(key)
+            os.chmod(KEY_FILE, 0o600)
+            print(f"✓ Listening on {ADDRESS[0]}:{ADDRESS[1]}  (pid {os.getpid()})")
+            while True:
+                try:
+                    conn = listener.accept()
+                except Exception as e:  # failed auth handshake etc.
+                    print(f"  rejected connection: {e}")
+                    continue
+                with conn:
+                    request = conn.recv()
+                    cmd = request.get("cmd")
+                    if cmd == "render":
+                        t = time.perf_counter()
+                        result = render_jobs(request.get("only", []), request.get("force", False),
+                                             request.get("timeout", 300.0))
+                        result["wall"] = time.perf_counter() - t
+                        jobs += len(result["rows"])
+                        conn.send(result)
+                    elif cmd == "status":
+                        conn.send({"pid": os.getpid(), "uptime": time.time() - started,
+                                   "jobs": jobs, "modules": loaded})
+                    elif cmd == "stop":
+                        conn.send({"stopped": True})
+                        break
+                    else:
+                        conn.send({"error": f"unknown command {cmd!r}"})
+    finally:
+        KEY_FILE.unlink(missing_ok=True)
+
+
+# ── Thin client ──────────────────────────────────────────────────────────────
+
+def request(payload):
+    if not KEY_FILE.exists():
+        sys.exit("Render daemon is not running — start it with: python render_daemon.py serve")
+    try:
+        with Client(ADDRESS, authkey=KEY_FILE.read_bytes()) as conn:
+            conn.send(payload)
+            return conn.recv()
+    except ConnectionRefusedError:
+        sys.exit("Render daemon is not reachable — start it with: python render_daemon.py serve")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Warm render daemon for portfolio charts")
+    sub = parser.add_subparsers(dest="cmd", required=True)
+    sub.add_parser("serve", help="Start the daemon in the foreground")
+    render = sub.add_parser("render", help="Render charts through the daemon")
+    render.add_argument("only", nargs="*", help="Substring filters on task names")
+    render.add_argument("--force", action="store_true", help="Ignore the build manifest")
+    render.add_argument("--timeout", type=float, default=300.0, help="Per-chart timeout in seconds")
+    sub.add_parser("status", help="Show daemon status")
+    sub.add_parser("stop", help="Stop the daemon")
+    args = parser.parse_args()
+
+    if args.cmd == "serve":
+        serve()
+    elif args.cmd == "render":
+        start = time.perf_counter()
+        result = request({"cmd": "render", "only": args.only, "force": args.force, "timeout": args.timeout})
+        print(f"{result['current']} chart(s) already up to date")
+        if result["rows"]:
+            build_charts.print_summary(result["rows"], time.perf_counter() - start)
+        sys.exit(0 if all(r["status"] == "ok" for r in result["rows"]) else 1)
+    elif args.cmd == "status":
+        status = request({"cmd": "status"})
+        print(f"pid {status['pid']}  |  up {status['uptime']:.0f}s  |  {status['jobs']} jobs rendered")
+        print(f"warm modules: {', '.join(status['modules'])}")
+    elif args.cmd == "stop":
+        request({"cmd": "stop"})
+        print("Render daemon stopped.")
+
+
+if __name__ == "__main__":
+    main()
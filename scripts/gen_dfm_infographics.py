@@ -11,26 +11,18 @@ from matplotlib.patches import FancyBboxPatch, FancyArrowPatch
 import matplotlib.patheffects as pe
 import numpy as np
 import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from chart_kit import (NAVY, WHITE, LIGHT, SLATE, BORDER, AMBER, GREEN, INDIGO,
+                       SKY, ROSE, ORANGE, TEAL, PURPLE)
+from chart_output import save_vector_first
 
 # ── Output directory ──────────────────────────────────────────────────────────
-OUT = r"C:\Users\sorat\Desktop\Coding\portfolio_my\public\images\projects\dfm-ipo-readiness"
+OUT = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..",
+                                   "public", "images", "projects", "dfm-ipo-readiness"))
 os.makedirs(OUT, exist_ok=True)
 
-# ── Palette ───────────────────────────────────────────────────────────────────
-NAVY      = "#001F5B"
-WHITE     = "#FFFFFF"
-LIGHT     = "#F1F5F9"
-SLATE     = "#475569"
-BORDER    = "#CBD5E1"
-AMBER     = "#F59E0B"
-GREEN     = "#10B981"
-INDIGO    = "#4F46E5"
-SKY       = "#0EA5E9"
-ROSE      = "#F43F5E"
-ORANGE    = "#F97316"
-TEAL      = "#14B8A6"
-PURPLE    = "#8B5CF6"
-
 plt.rcParams.update({
     'font.family': 'DejaVu Sans',
     'axes.facecolor': WHITE,
@@ -197,10 +189,9 @@ def chart_programme_architecture():
                              facecolor=NAVY, edgecolor='none')
     ax.add_patch(footer)
 
-    plt.savefig(os.path.join(OUT, 'programme-architecture.png'),
-                dpi=150, bbox_inches='tight', facecolor=WHITE)
-    plt.close()
-    print("✓ programme-architecture.png")
+    # Flat boxes and text: published as SVG when that is smaller than the raster
+    fmt = save_vector_first(fig, os.path.join(OUT, 'programme-architecture.png'), dpi=150, facecolor=WHITE)
+    print(f"✓ programme-architecture.{fmt}")
 
 
 # =============================================================================
@@ -297,10 +288,9 @@ def chart_icofr_coverage():
             va='center', fontsize=8, color=SLATE, fontweight='bold')
 
     fig.tight_layout(rect=[0, 0, 1, 1])
-    plt.savefig(os.path.join(OUT, 'icofr-process-coverage.png'),
-                dpi=150, bbox_inches='tight', facecolor=WHITE)
-    plt.close()
-    print("✓ icofr-process-coverage.png")
+    # Flat bars and text: published as SVG when that is smaller than the raster
+    fmt = save_vector_first(fig, os.path.join(OUT, 'icofr-process-coverage.png'), dpi=150, facecolor=WHITE)
+    print(f"✓ icofr-process-coverage.{fmt}")
 
 
 # =============================================================================
@@ -469,10 +459,9 @@ def chart_three_lines():
             "Three Lines Model embedded across UAE holding company and 7 operating subsidiaries ahead of DFM listing  |  KPMG External Advisory",
             ha='center', va='center', color=SLATE, fontsize=8, style='italic')
 
-    plt.savefig(os.path.join(OUT, 'three-lines-defence.png'),
-                dpi=150, bbox_inches='tight', facecolor=WHITE)
-    plt.close()
-    print("✓ three-lines-defence.png")
+    # Flat boxes and text: published as SVG when that is smaller than the raster
+    fmt = save_vector_first(fig, os.path.join(OUT, 'three-lines-defence.png'), dpi=150, facecolor=WHITE)
+    print(f"✓ three-lines-defence.{fmt}")
 
 
 # =============================================================================
@@ -583,10 +572,8 @@ def chart_readiness_scorecard():
                  "Engagement delivered as KPMG external advisor\noverseeing company's internal IPO readiness programme",
                  ha='center', va='bottom', color=SLATE, fontsize=7.5, style='italic')
 
-    plt.savefig(os.path.join(OUT, 'readiness-scorecard.png'),
-                dpi=150, bbox_inches='tight', facecolor=WHITE)
-    plt.close()
-    print("✓ readiness-scorecard.png")
+    fmt = save_vector_first(fig, os.path.join(OUT, 'readiness-scorecard.png'), dpi=150, facecolor=WHITE)
+    print(f"✓ readiness-scorecard.{fmt}")
 
 
 # =============================================================================
@@ -0,0 +1,227 @@
+"""
+Local Batch-Scoring Service — Fraud Risk & Severity Models
+===========================================================
+Loads src/data/fraud-risk-model.json and src/data/severity-model.json once,
+keeps them in memory and scores whole JSON or CSV batches with vectorised
+numpy inference (the same polynomial → scaler → softmax pipeline the
+FraudRiskCalculator and SeverityClassifier components run in the browser).
+
+Endpoints:
+    POST /score/fraud-risk   rows of {opportunity, pressure, rationalization, controls} (1-5)
+    POST /score/severity     rows of {exposure, likelihood, detection, scope} (1-3)
+    GET  /metrics            per-model request/row counts, latency percentiles, throughput
+    GET  /health
+
+Request bodies are either JSON (a list of objects, or {"rows": [...]}) or
+CSV with a header row (Content-Type: text/csv). Send "Accept: text/csv" to
+get the input rows back with class/confidence/probability columns appended.
+
+Usage:
+    python scripts/score_server.py --port 8765
+"""
+
+import argparse
+import csv
+import io
+import json
+import threading
+import time
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+import numpy as np
+
+DATA_DIR = Path(__file__).resolve().parent.parent / "src" / "data"
+
+MODELS = {
+    "fraud-risk": ("fraud-risk-model.json", ["opportunity", "pressure", "rationalization", "controls"], (1, 5)),
+    "severity": ("severity-model.json", ["exposure", "likelihood", "detection", "scope"], (1, 3)),
+}
+
+
+class BatchModel:
+    """Polynomial logistic-regression model held as numpy arrays for batch inference"""
+
+    def __init__(self, path, features, value_range):
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        self.classes = data["classes"]
+        self.features = features
+        self.value_range = value_range
+        self.powers = np.array(data["poly_powers"], dtype=float)        # (n_poly, n_in)
+        self.mean = np.array(data["scaler_mean"], dtype=float)
+        self.scale = np.array(data["scaler_scale"], dtype=float)
+        self.coef = np.array(data["coef"], dtype=float).T                # (n_poly, n_classes)
+        self.intercept = np.array(data["intercept"], dtype=float)
+
+    def predict_proba(self, X):
+        """Class probabilities for an (n, n_features) input matrix"""
+        poly = np.prod(X[:, np.newaxis, :] ** self.powers[np.newaxis, :, :], axis=2)
+        logits = ((poly - self.mean) / self.scale) @ self.coef + self.intercept
+        logits -= logits.max(axis=1, keepdims=True)
+        exps = np.exp(logits)
+        return exps / exps.sum(axis=1, keepdims=True)
+
+    def matrix(self, rows):
+        """Validate input rows (dicts) and build the feature matrix"""
+        if not rows:
+            raise ValueError("No rows to score")
+        lo, hi = self.value_range
+        try:
+            X = np.array([[float(row[f]) for f in self.features] for row in rows], dtype=float)
+        except KeyError as e:
+            raise ValueError(f"Missing field {e.args[0]!r}; expected {self.features}") from None
+        except (TypeError, ValueError):
+            raise ValueError(f"Non-numeric value in fields {self.features}") from None
+        bad = ~np.isfinite(X) | (X < lo) | (X > hi)
+        if bad.any():
+            row, col = np.argwhere(bad)[0]
+            raise ValueError(f"Row {row}: {self.features[col]} must be between {lo} and {hi}")
+        return X
+
+    def score(self, rows):
+        probs = self.predict_proba(self.matrix(rows))
+        winners = probs.argmax(axis=1)
+        pct = np.floor(probs * 100 + 0.5).astype(int)  # half-up, like Math.round in the browser
+        return [
+            {
+                "class": self.classes[w],
+                "confidence": int(pct[i, w]),
+                "probabilities": dict(zip(self.classes, pct[i].tolist())),
+            }
+            for i, w in enumerate(winners)
+        ]
+
+
+class Metrics:
+    """Thread-safe request counters with a rolling latency window per model"""
+
+    def __init__(self, window=1000):
+        self.lock = threading.Lock()
+        self.started = time.time()
+        self.window = window
+        self.models = {}
+
+    def record(self, model, rows, seconds):
+        with self.lock:
+            m = self.models.setdefault(model, {
+                "requests": 0, "rows": 0, "seconds": 0.0,
+                "latencies": deque(maxlen=self.window),
+            })
+            m["requests"] += 1
+            m["rows"] += rows
+            m["seconds"] += seconds
+            m["latencies"].append(seconds)
+
+    def snapshot(self):
+        with self.lock:
+            out = {"uptime_seconds": round(time.time() - self.started, 1), "models": {}}
+            for name, m in self.models.items():
+                lat = np.array(m["latencies"]) * 1000
+                out["models"][name] = {
+                    "requests": m["requests"],
+                    "rows": m["rows"],
+                    "latency_ms_p50": round(float(np.percentile(lat, 50)), 3),
+                    "latency_ms_p95": round(float(np.percentile(lat, 95)), 3),
+                    "latency_ms_max": round(float(lat.max()), 3),
+                    "rows_per_second": round(m["rows"] / m["seconds"], 1) if m["seconds"] else None,
+                }
+            return out
+
+
+class ScoringHandler(BaseHTTPRequestHandler):
+    models = {}
+    metrics = Metrics()
+    max_body = 64 * 1024 * 1024
+
+    def log_message(self, fmt, *args):
+        pass
+
+    def _send(self, status, body, content_type="application/json"):
+        payload = body if isinstance(body, bytes) else json.dumps(body).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def _rows(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        if length > self.max_body:
+            raise ValueError(f"Request body exceeds {self.max_body // (1024 * 1024)} MB")
+        raw = self.rfile.read(length).decode("utf-8-sig")
+        if "csv" in (self.headers.get("Content-Type") or ""):
+            return list(csv.DictReader(io.StringIO(raw)))
+        body = json.loads(raw)
+        rows = body.get("rows") if isinstance(body, dict) else body
+        if not isinstance(rows, list):
+            raise ValueError('Expected a JSON list of rows or {"rows": [...]}')
+        return rows
+
+    def do_GET(self):
+        if self.path == "/health":
+            self._send(200, {"status": "ok", "models": sorted(self.models)})
+        elif self.path == "/metrics":
+            self._send(200, self.metrics.snapshot())
+        else:
+            self._send(404, {"error": f"Unknown path {self.path}"})
+
+    def do_POST(self):
+        name = self.path.removeprefix("/score/")
+        model = self.models.get(name) if self.path.startswith("/score/") else None
+        if model is None:
+            self._send(404, {"error": f"Unknown model endpoint {self.path}"})
+            return
+
+        start = time.perf_counter()
+        try:
+            rows = self._rows()
+            results = model.score(rows)
+        except (ValueError, json.JSONDecodeError) as e:
+            self._send(400, {"error": str(e)})
+            return
+        elapsed = time.perf_counter() - start
+        self.metrics.record(name, len(rows), elapsed)
+
+        if "text/csv" in (self.headers.get("Accept") or ""):
+            out = io.StringIO()
+            fields = list(rows[0].keys()) + ["class", "confidence"] + [f"p_{c}" for c in model.classes]
+            writer = csv.DictWriter(out, fieldnames=fields, extrasaction="ignore")
+            writer.writeheader()
+            for row, res in zip(rows, results):
+                writer.writerow({**row, "class": res["class"], "confidence": res["confidence"],
+                                 **{f"p_{c}": p for c, p in res["probabilities"].items()}})
+            self._send(200, out.getvalue().encode("utf-8"), "text/csv")
+        else:
+            self._send(200, {"model": name, "count": len(results),
+                             "elapsed_ms": round(elapsed * 1000, 3), "results": results})
+
+
+def load_models(data_dir=DATA_DIR):
+    return {
+        name: BatchModel(Path(data_dir) / filename, features, value_range)
+        for name, (filename, features, value_range) in MODELS.items()
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local batch-scoring service for the portfolio ML models")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--data-dir", default=str(DATA_DIR))
+    args = parser.parse_args()
+
+    ScoringHandler.models = load_models(args.data_dir)
+    server = ThreadingHTTPServer((args.host, args.port), ScoringHandler)
+    print(f"✓ Loaded models: {', '.join(sorted(ScoringHandler.models))}")
+    print(f"✓ Serving on http://{args.host}:{args.port}  (POST /score/<model>, GET /metrics)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\nShutting down.")
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+"""Tests for the screenshot deploy driver"""
+
+import sys
+from pathlib import Path
+
+from PIL import Image
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import deploy_screenshots  # noqa: E402
+from optimize_manifest import OptimizationManifest  # noqa: E402
+
+
+def _target(stem):
+    return {"stem": str(stem), "max_width": 800, "page_height": None, "png": None,
+            "webp": {"quality": 80}, "alternates": []}
+
+
+def test_run_with_several_workers(tmp_path, monkeypatch):
+    monkeypatch.setattr(deploy_screenshots, "OptimizationManifest",
+                        lambda: OptimizationManifest(tmp_path / "manifest.json"))
+    sources = {}
+    for i in range(3):
+        path = tmp_path / f"shot{i}.png"
+        Image.new("RGB", (1200, 900), (40 * i, 80, 120)).save(path)
+        sources[str(path)] = [_target(tmp_path / "out" / f"shot{i}")]
+    (tmp_path / "out").mkdir()
+
+    rows = deploy_screenshots.run(sources, jobs=2)
+    assert len(rows) == 3 and all(r["ok"] for r in rows)
+    for i in range(3):
+        with Image.open(tmp_path / "out" / f"shot{i}.webp") as out:
+            assert out.size == (800, 600)
+
+
+def test_plan_gives_shared_outputs_to_the_first_job():
+    config = {"jobs": {
+        "final": {"source_dir": "a", "dest_dir": "out", "images": {"x.png": "shot", "y.png": "other"}},
+        "older": {"source_dir": "b", "dest_dir": "out", "images": {"x.png": "shot"}},
+    }, "defaults": {"max_width": None, "png": None, "webp": {}, "alternates": []}}
+    sources = deploy_screenshots.plan(config, ["older", "final"])
+    root = deploy_screenshots.ROOT
+    assert sorted(sources) == [str(root / "a" / "x.png"), str(root / "a" / "y.png")]
+
+
+def test_paged_target_counts_every_page_of_the_served_format():
+    sizes = {"a.png": 900, "a-p1.webp": 300, "a-p2.webp": 300, "a-p1.avif": 250, "a-p2.avif": 280}
+    assert deploy_screenshots._served_bytes(sizes) == 530
@@ -0,0 +1,30 @@
+"""Regression tests for the screenshot optimizer's decode path"""
+
+import sys
+from pathlib import Path
+
+import pytest
+from PIL import Image
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from optimize_screenshots import ScreenshotOptimizer, open_for_web  # noqa: E402
+
+
+@pytest.mark.parametrize("suffix", [".png", ".jpg"])
+def test_open_for_web_small_rgb_source(tmp_path, suffix):
+    """A source needing no resize comes back usable after its file is closed"""
+    path = tmp_path / f"small{suffix}"
+    Image.new("RGB", (1000, 800), (200, 30, 30)).save(path)
+    img = open_for_web(path, 1920)
+    assert img.mode == "RGB" and img.size == (1000, 800)
+    assert img.getpixel((10, 10))[0] > 150
+
+
+def test_optimize_image_small_rgb_source(tmp_path):
+    path = tmp_path / "small.png"
+    Image.new("RGB", (1000, 800), (255, 255, 255)).save(path)
+    optimizer = ScreenshotOptimizer(tmp_path, alt_formats=[])
+    assert optimizer.optimize_image(path) == tmp_path / "small.webp"
+    with Image.open(tmp_path / "small.webp") as out:
+        assert out.size == (1000, 800)